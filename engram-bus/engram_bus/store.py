@@ -19,6 +19,11 @@ def _uid() -> str:
     return uuid.uuid4().hex[:12]
 
 
+def _dumps(value: Any) -> str:
+    """Compact JSON encoding for stored fields (no whitespace between tokens)."""
+    return json.dumps(value, separators=(",", ":"))
+
+
 class HandoffStore:
     """SQLite-backed durable storage for agent handoff coordination.
 
@@ -96,10 +101,10 @@ class HandoffStore:
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     sid, agent_id, repo, status, task_summary,
-                    json.dumps(decisions or []),
-                    json.dumps(files_touched or []),
-                    json.dumps(todos or []),
-                    json.dumps(metadata or {}),
+                    _dumps(decisions or []),
+                    _dumps(files_touched or []),
+                    _dumps(todos or []),
+                    _dumps(metadata or {}),
                     now, now,
                 ),
             )
@@ -160,7 +165,7 @@ class HandoffStore:
             if k not in allowed:
                 continue
             if k in json_fields:
-                v = json.dumps(v)
+                v = _dumps(v)
             sets.append(f"{k} = ?")
             params.append(v)
         if not sets:
@@ -199,7 +204,7 @@ class HandoffStore:
                 """INSERT INTO handoff_lanes
                    (id, session_id, from_agent, to_agent, status, context, created, updated)
                    VALUES (?, ?, ?, ?, 'open', ?, ?, ?)""",
-                (lid, session_id, from_agent, to_agent, json.dumps(context or {}), now, now),
+                (lid, session_id, from_agent, to_agent, _dumps(context or {}), now, now),
             )
             self._conn.commit()
         return lid
@@ -258,7 +263,7 @@ class HandoffStore:
                 """INSERT INTO handoff_checkpoints
                    (id, session_id, lane_id, agent_id, snapshot, created)
                    VALUES (?, ?, ?, ?, ?, ?)""",
-                (cid, session_id, lane_id, agent_id, json.dumps(snapshot), now),
+                (cid, session_id, lane_id, agent_id, _dumps(snapshot), now),
             )
             self._conn.commit()
         return cid
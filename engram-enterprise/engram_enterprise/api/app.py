@@ -24,6 +24,7 @@ from engram_enterprise.api.auth import (
 )
 from engram_enterprise.api.schemas import (
     AddMemoryRequestV2,
+    AgentPolicyBulkRequest,
     AgentPolicyUpsertRequest,
     CommitResolutionRequest,
     ConflictResolutionRequest,
@@ -40,6 +41,7 @@ from engram_enterprise.api.schemas import (
     SessionCreateRequest,
     SessionCreateResponse,
 )
+from engram_enterprise.kernel import PersonalMemoryKernel
 from engram_enterprise.policy import feature_enabled
 from engram.exceptions import FadeMemValidationError
 from engram.observability import add_metrics_routes, logger as structured_logger, metrics
@@ -102,6 +104,7 @@ app.add_middleware(
 add_metrics_routes(app)
 
 _memory: Optional[Memory] = None
+_kernel: Optional[PersonalMemoryKernel] = None
 _memory_lock = threading.Lock()
 
 
@@ -114,8 +117,25 @@ def get_memory() -> Memory:
     return _memory
 
 
-def get_kernel():
-    return get_memory().kernel
+def set_memory(memory: Optional[Memory]) -> None:
+    """Swap the process-wide Memory and drop the kernel built on the old one."""
+    global _memory, _kernel
+    with _memory_lock:
+        _memory = memory
+        _kernel = None
+
+
+def get_kernel() -> PersonalMemoryKernel:
+    global _kernel
+    memory = get_memory()
+    kernel = _kernel
+    # Also rebuilt if _memory was reassigned directly instead of via set_memory().
+    if kernel is None or kernel.memory is not memory:
+        with _memory_lock:
+            kernel = _kernel
+            if kernel is None or kernel.memory is not memory:
+                kernel = _kernel = PersonalMemoryKernel(memory)
+    return kernel
 
 
 def _extract_content(messages: Optional[Union[str, List[Dict[str, Any]]]], content: Optional[str]) -> str:
@@ -737,6 +757,29 @@ async def delete_agent_policy(
         raise require_session_error(exc)
 
 
+@app.post("/v1/agent-policies/bulk")
+async def bulk_agent_policies(
+    request: AgentPolicyBulkRequest,
+    http_request: Request,
+    requester_agent_id: Optional[str] = Query(default=None),
+):
+    """Run several agent-policy operations in one request, results in order.
+
+    All-or-nothing: see :meth:`PersonalMemoryKernel.bulk_agent_policies`.
+    """
+    token = get_token_from_request(http_request)
+    kernel = get_kernel()
+    try:
+        results = kernel.bulk_agent_policies(
+            [op.model_dump() for op in request.ops],
+            token=token,
+            requester_agent_id=requester_agent_id,
+        )
+    except PermissionError as exc:
+        raise require_session_error(exc)
+    return {"results": results, "count": len(results)}
+
+
 @app.post("/v1/sleep/run")
 async def run_sleep_cycle(
     request: SleepRunRequest,
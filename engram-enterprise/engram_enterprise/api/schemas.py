@@ -168,3 +168,17 @@ class AgentPolicyUpsertRequest(BaseModel):
     )
     allowed_capabilities: List[str] = Field(default_factory=lambda: list(DEFAULT_CAPABILITIES))
     allowed_namespaces: List[str] = Field(default_factory=lambda: ["default"])
+
+
+class AgentPolicyBulkOp(BaseModel):
+    op: Literal["upsert", "get", "list", "delete"]
+    user_id: str = Field(default="default")
+    agent_id: Optional[str] = Field(default=None)
+    include_wildcard: bool = Field(default=True)
+    allowed_confidentiality_scopes: Optional[List[str]] = Field(default=None)
+    allowed_capabilities: Optional[List[str]] = Field(default=None)
+    allowed_namespaces: Optional[List[str]] = Field(default=None)
+
+
+class AgentPolicyBulkRequest(BaseModel):
+    ops: List[AgentPolicyBulkOp] = Field(default_factory=list)
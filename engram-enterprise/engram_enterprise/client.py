@@ -416,3 +416,7 @@ class MemoryClient:
             "/v1/agent-policies",
             params={"user_id": user_id, "agent_id": agent_id},
         )
+
+    def bulk_agent_policies(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run upsert/get/list/delete policy ops in one round-trip, results in order."""
+        return self._request("POST", "/v1/agent-policies/bulk", json_body={"ops": list(ops)})
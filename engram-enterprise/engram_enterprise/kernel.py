@@ -28,6 +28,16 @@ from engram_enterprise.staging_store import StagingStore
 from engram.observability import metrics
 from engram_enterprise.dual_search import DualSearchEngine
 
+_HANDOFF_CAPABILITY_SET = frozenset(HANDOFF_CAPABILITIES)
+
+# Proposal write quotas: (env var, label, per-agent, window length).
+_WRITE_QUOTA_WINDOWS = (
+    ("ENGRAM_V2_POLICY_WRITE_QUOTA_PER_USER_PER_HOUR", "per-user hourly", False, timedelta(hours=1)),
+    ("ENGRAM_V2_POLICY_WRITE_QUOTA_PER_USER_PER_DAY", "per-user daily", False, timedelta(days=1)),
+    ("ENGRAM_V2_POLICY_WRITE_QUOTA_PER_AGENT_PER_HOUR", "per-agent hourly", True, timedelta(hours=1)),
+    ("ENGRAM_V2_POLICY_WRITE_QUOTA_PER_AGENT_PER_DAY", "per-agent daily", True, timedelta(days=1)),
+)
+
 
 class PersonalMemoryKernel:
     """Coordinates policy, retrieval, and staged writes for v2."""
@@ -97,8 +107,7 @@ class PersonalMemoryKernel:
                 raise PermissionError(f"No agent policy configured for user={user_id} agent={agent_id}")
 
         requested_caps = set(normalized_capabilities)
-        handoff_caps = set(HANDOFF_CAPABILITIES)
-        if requested_caps & handoff_caps:
+        if requested_caps & _HANDOFF_CAPABILITY_SET:
             if agent_id and not policy:
                 policy = self._bootstrap_handoff_policy_if_trusted(
                     user_id=user_id,
@@ -382,7 +391,7 @@ class PersonalMemoryKernel:
 
     @staticmethod
     def _is_namespace_allowed(namespace: str, allowed_namespaces: List[str]) -> bool:
-        return "*" in allowed_namespaces or namespace in set(allowed_namespaces)
+        return "*" in allowed_namespaces or namespace in allowed_namespaces
 
     def _mask_for_namespace(self, item: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -455,56 +464,25 @@ class PersonalMemoryKernel:
         if not feature_enabled("ENGRAM_V2_POLICY_GATEWAY", default=True):
             return
 
-        now = datetime.now(timezone.utc)
-        windows: List[Dict[str, Any]] = [
-            {
-                "env": "ENGRAM_V2_POLICY_WRITE_QUOTA_PER_USER_PER_HOUR",
-                "label": "per-user hourly",
-                "user_id": user_id,
-                "agent_id": None,
-                "since": (now - timedelta(hours=1)).isoformat(),
-            },
-            {
-                "env": "ENGRAM_V2_POLICY_WRITE_QUOTA_PER_USER_PER_DAY",
-                "label": "per-user daily",
-                "user_id": user_id,
-                "agent_id": None,
-                "since": (now - timedelta(days=1)).isoformat(),
-            },
-        ]
-        if agent_id:
-            windows.extend(
-                [
-                    {
-                        "env": "ENGRAM_V2_POLICY_WRITE_QUOTA_PER_AGENT_PER_HOUR",
-                        "label": "per-agent hourly",
-                        "user_id": user_id,
-                        "agent_id": agent_id,
-                        "since": (now - timedelta(hours=1)).isoformat(),
-                    },
-                    {
-                        "env": "ENGRAM_V2_POLICY_WRITE_QUOTA_PER_AGENT_PER_DAY",
-                        "label": "per-agent daily",
-                        "user_id": user_id,
-                        "agent_id": agent_id,
-                        "since": (now - timedelta(days=1)).isoformat(),
-                    },
-                ]
-            )
+        quotas = [q for q in _WRITE_QUOTA_WINDOWS if agent_id or not q[2]]
+        limits = [self._parse_int_env(q[0], 0) for q in quotas]
+        # Quotas are off unless configured; skip the window math entirely.
+        if not any(limit > 0 for limit in limits):
+            return
 
-        for window in windows:
-            limit = self._parse_int_env(window["env"], 0)
+        now = datetime.now(timezone.utc)
+        for (_, label, per_agent, span), limit in zip(quotas, limits):
             if limit <= 0:
                 continue
 
             count = self.db.count_proposal_commits(
-                user_id=window["user_id"],
-                agent_id=window["agent_id"],
-                since=window["since"],
+                user_id=user_id,
+                agent_id=agent_id if per_agent else None,
+                since=(now - span).isoformat(),
             )
             if count >= limit:
                 raise PermissionError(
-                    f"Write quota exceeded ({window['label']}): "
+                    f"Write quota exceeded ({label}): "
                     f"{count}/{limit} proposals in active window"
                 )
 
@@ -602,6 +580,7 @@ class PersonalMemoryKernel:
         )
         scenes = self.episodic_store.search_scenes(user_id=user_id, query=query, limit=limit)
         # Scene masking is coarse: mask summaries if no permitted scope.
+        allowed_scope_set = frozenset(allowed_scopes or [])
         masked_scenes = []
         for scene in scenes:
             scene_namespace = self._normalize_namespace(scene.get("namespace"))
@@ -614,7 +593,7 @@ class PersonalMemoryKernel:
                 masked_scenes.append(visible_scene)
                 continue
             scope = normalize_confidentiality_scope(scene.get("confidentiality_scope") or "work")
-            if scope in set(allowed_scopes or []):
+            if scope in allowed_scope_set:
                 visible_scene = dict(scene)
                 visible_scene["masked"] = False
                 masked_scenes.append(visible_scene)
@@ -668,7 +647,7 @@ class PersonalMemoryKernel:
         if not self._is_namespace_allowed(scene_namespace, allowed_namespaces):
             return self._mask_for_namespace(scene)
         scope = normalize_confidentiality_scope(scene.get("confidentiality_scope") or "work")
-        if scope in set(allowed_scopes or []):
+        if scope in (allowed_scopes or []):
             scene["masked"] = False
             return scene
         return {
@@ -1336,25 +1315,30 @@ class PersonalMemoryKernel:
                 # Gap 4: Cascade traces (deep sleep)
                 if distillation_config.enable_multi_trace:
                     try:
-                        from engram.core.traces import cascade_traces, compute_effective_strength
-                        traced_memories = self.db.get_all_memories(
-                            user_id=uid,
+                        from engram.core.traces import (
+                            cascade_traces_batch,
+                            compute_effective_strength_batch,
                         )
-                        cascade_count = 0
-                        for mem in traced_memories:
-                            if mem.get("s_fast") is None:
-                                continue
-                            s_f, s_m, s_s = cascade_traces(
-                                s_fast=float(mem.get("s_fast", 0.0)),
-                                s_mid=float(mem.get("s_mid", 0.0)),
-                                s_slow=float(mem.get("s_slow", 0.0)),
-                                config=distillation_config,
-                                deep_sleep=True,
-                            )
-                            eff = compute_effective_strength(s_f, s_m, s_s, distillation_config)
+                        traced_memories = [
+                            mem for mem in self.db.get_all_memories(user_id=uid)
+                            if mem.get("s_fast") is not None
+                        ]
+                        cascaded = cascade_traces_batch(
+                            [
+                                (
+                                    float(mem.get("s_fast", 0.0)),
+                                    float(mem.get("s_mid", 0.0)),
+                                    float(mem.get("s_slow", 0.0)),
+                                )
+                                for mem in traced_memories
+                            ],
+                            distillation_config,
+                            deep_sleep=True,
+                        )
+                        effective = compute_effective_strength_batch(cascaded, distillation_config)
+                        for mem, (s_f, s_m, s_s), eff in zip(traced_memories, cascaded, effective):
                             self.db.update_multi_trace(mem["id"], s_f, s_m, s_s, eff)
-                            cascade_count += 1
-                        user_stats["trace_cascades"] = cascade_count
+                        user_stats["trace_cascades"] = len(traced_memories)
                     except Exception as e:
                         user_stats["trace_cascades"] = {"error": str(e)}
 
@@ -1552,6 +1536,65 @@ class PersonalMemoryKernel:
         deleted = self.db.delete_agent_policy(user_id=user_id, agent_id=agent_id)
         return {"deleted": bool(deleted), "user_id": user_id, "agent_id": agent_id}
 
+    def bulk_agent_policies(
+        self,
+        ops: List[Dict[str, Any]],
+        *,
+        token: Optional[str] = None,
+        requester_agent_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run upsert/get/list/delete policy ops in order; one result per op.
+
+        Every op's user is authorized before any op runs, and the ops share
+        one store transaction, so a failing op leaves none of the batch
+        applied. An op missing its ``agent_id`` gets an error result instead.
+        """
+        if token or requester_agent_id:
+            for user_id in dict.fromkeys(op.get("user_id", "default") for op in ops):
+                self.authenticate_session(
+                    token=token,
+                    user_id=user_id,
+                    agent_id=requester_agent_id,
+                    require_for_agent=bool(requester_agent_id),
+                    required_capabilities=["manage_namespaces"],
+                )
+        auth = {"token": token, "requester_agent_id": requester_agent_id}
+        results: List[Dict[str, Any]] = []
+        with self.db.transaction():
+            for op in ops:
+                kind = op.get("op")
+                user_id = op.get("user_id", "default")
+                agent_id = op.get("agent_id")
+                if kind == "list":
+                    policies = self.list_agent_policies(user_id=user_id, **auth)
+                    results.append({"policies": policies, "count": len(policies)})
+                    continue
+                if not agent_id:
+                    results.append({"error": f"agent_id is required for '{kind}'"})
+                    continue
+                if kind == "upsert":
+                    results.append(
+                        self.upsert_agent_policy(
+                            user_id=user_id,
+                            agent_id=agent_id,
+                            allowed_confidentiality_scopes=op.get("allowed_confidentiality_scopes"),
+                            allowed_capabilities=op.get("allowed_capabilities"),
+                            allowed_namespaces=op.get("allowed_namespaces"),
+                            **auth,
+                        )
+                    )
+                elif kind == "get":
+                    policy = self.get_agent_policy(
+                        user_id=user_id,
+                        agent_id=agent_id,
+                        include_wildcard=op.get("include_wildcard", True),
+                        **auth,
+                    )
+                    results.append({"policy": policy})
+                else:
+                    results.append(self.delete_agent_policy(user_id=user_id, agent_id=agent_id, **auth))
+        return results
+
     # ------------------------------------------------------------------
     # Handoff session bus methods
     # ------------------------------------------------------------------
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
 
 
 def _coerce_float(value: Any, default: float = 0.0) -> float:
@@ -51,7 +52,6 @@ def intersection_promote(
     weight = min(1.0, max(0.0, _coerce_float(boost_weight, 0.22)))
     cap = min(1.0, max(0.0, _coerce_float(max_boost, 0.35)))
     signal_by_memory, scene_count_by_memory = _build_episodic_signal(episodic_scene_results)
-    episodic_memory_ids: Set[str] = set(signal_by_memory.keys())
 
     ranked: List[Tuple[float, float, int, Dict[str, Any]]] = []
     for semantic_rank, item in enumerate(semantic_results):
@@ -62,15 +62,15 @@ def intersection_promote(
         intersection_boost = min(cap, episodic_signal * weight)
         final_score = base_score * (1.0 + intersection_boost)
 
-        enriched["episodic_match"] = memory_id in episodic_memory_ids
+        enriched["episodic_match"] = memory_id in signal_by_memory
         enriched["episodic_scene_count"] = int(scene_count_by_memory.get(memory_id, 0))
-        enriched["episodic_signal"] = round(float(episodic_signal), 6)
-        enriched["intersection_boost"] = round(float(intersection_boost), 6)
-        enriched["base_composite_score"] = float(base_score)
-        enriched["composite_score"] = float(final_score)
+        enriched["episodic_signal"] = round(episodic_signal, 6)
+        enriched["intersection_boost"] = round(intersection_boost, 6)
+        enriched["base_composite_score"] = base_score
+        enriched["composite_score"] = final_score
 
         # Tie-breaking preserves semantic ranking deterministically.
-        ranked.append((float(final_score), float(base_score), -semantic_rank, enriched))
+        ranked.append((final_score, base_score, -semantic_rank, enriched))
 
-    ranked.sort(key=lambda row: (row[0], row[1], row[2]), reverse=True)
+    ranked.sort(key=itemgetter(0, 1, 2), reverse=True)
     return [row[3] for row in ranked]
@@ -3,9 +3,11 @@
 import os
 import sqlite3
 import tempfile
+from contextlib import contextmanager
 
 import pytest
 
+from engram_enterprise.kernel import PersonalMemoryKernel
 from engram_enterprise.schema import extend_schema, ENTERPRISE_MIGRATIONS
 
 
@@ -115,3 +117,116 @@ class TestEnterpriseImports:
     def test_reranker_importable(self):
         from engram_enterprise.reranker import intersection_promote
         assert callable(intersection_promote)
+
+
+class _PolicyStore:
+    """Policy table stand-in whose transaction() commits or discards writes."""
+
+    def __init__(self):
+        self.policies = {}
+        self._pending = None
+
+    @contextmanager
+    def transaction(self):
+        self._pending = dict(self.policies)
+        try:
+            yield self
+            self.policies = self._pending
+        finally:
+            self._pending = None
+
+    def upsert_agent_policy(self, *, user_id, agent_id, **fields):
+        self._pending[(user_id, agent_id)] = fields
+        return {"user_id": user_id, "agent_id": agent_id}
+
+    def delete_agent_policy(self, *, user_id, agent_id):
+        return self._pending.pop((user_id, agent_id), None) is not None
+
+
+class _PolicyKernel(PersonalMemoryKernel):
+    """Kernel over _PolicyStore; sessions may only manage ``default``."""
+
+    def __init__(self):
+        self.db = _PolicyStore()
+        self.db.policies[("default", "a2")] = {}
+
+    def authenticate_session(self, *, token, user_id, agent_id, require_for_agent=True, required_capabilities=None):
+        if user_id != "default":
+            raise PermissionError("Session user scope mismatch")
+        return {"user_id": "default"}
+
+    def upsert_agent_policy(self, *, user_id, agent_id, token=None, requester_agent_id=None, **kwargs):
+        if agent_id == "broken":
+            raise ValueError("invalid policy")
+        return self.db.upsert_agent_policy(user_id=user_id, agent_id=agent_id)
+
+
+class TestAgentPolicyBulk:
+    def test_unauthorized_op_rejects_whole_batch(self):
+        kernel = _PolicyKernel()
+        with pytest.raises(PermissionError):
+            kernel.bulk_agent_policies(
+                [
+                    {"op": "upsert", "user_id": "default", "agent_id": "a1"},
+                    {"op": "delete", "user_id": "default", "agent_id": "a2"},
+                    {"op": "upsert", "user_id": "other", "agent_id": "a3"},
+                ],
+                token="tok",
+            )
+        assert kernel.db.policies == {("default", "a2"): {}}
+
+    def test_failing_op_rolls_back_earlier_ops(self):
+        kernel = _PolicyKernel()
+        with pytest.raises(ValueError):
+            kernel.bulk_agent_policies(
+                [
+                    {"op": "upsert", "user_id": "default", "agent_id": "a1"},
+                    {"op": "delete", "user_id": "default", "agent_id": "a2"},
+                    {"op": "upsert", "user_id": "default", "agent_id": "broken"},
+                ],
+                token="tok",
+            )
+        assert kernel.db.policies == {("default", "a2"): {}}
+
+    def test_ops_run_in_order(self):
+        kernel = _PolicyKernel()
+        results = kernel.bulk_agent_policies(
+            [
+                {"op": "upsert", "user_id": "default", "agent_id": "a1"},
+                {"op": "delete", "user_id": "default"},
+                {"op": "delete", "user_id": "default", "agent_id": "a2"},
+            ],
+            token="tok",
+        )
+        assert results == [
+            {"user_id": "default", "agent_id": "a1"},
+            {"error": "agent_id is required for 'delete'"},
+            {"deleted": True, "user_id": "default", "agent_id": "a2"},
+        ]
+        assert kernel.db.policies == {("default", "a1"): {}}
+
+    def test_client_posts_ops(self, monkeypatch):
+        import requests
+        from engram_enterprise.client import MemoryClient
+
+        sent = {}
+
+        class _Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"results": [], "count": 0}
+
+        def _request(method, url, headers=None, params=None, json=None, timeout=None):
+            sent.update(method=method, url=url, json=json)
+            return _Response()
+
+        monkeypatch.setattr(requests, "request", _request)
+        ops = [{"op": "list", "user_id": "default"}]
+        MemoryClient(api_key="tok", host="http://testserver").bulk_agent_policies(ops)
+        assert sent == {
+            "method": "POST",
+            "url": "http://testserver/v1/agent-policies/bulk",
+            "json": {"ops": ops},
+        }
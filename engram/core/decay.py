@@ -5,7 +5,7 @@ Requires engram-accel (Rust) for the core decay math.
 
 import math
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from engram.configs.base import FadeMemConfig
@@ -24,6 +24,7 @@ def calculate_decayed_strength(
     access_count: int,
     layer: str,
     config: "FadeMemConfig",
+    now: Optional[datetime] = None,
 ) -> float:
     if isinstance(last_accessed, str):
         last_accessed = datetime.fromisoformat(last_accessed)
@@ -33,7 +34,8 @@ def calculate_decayed_strength(
     if math.isnan(current_strength):
         return 0.0
 
-    time_elapsed_days = (datetime.now(timezone.utc) - last_accessed).total_seconds() / 86400.0
+    now = now or datetime.now(timezone.utc)
+    time_elapsed_days = (now - last_accessed).total_seconds() / 86400.0
     decay_rate = config.sml_decay_rate if layer == "sml" else config.lml_decay_rate
 
     return _rs_decay(
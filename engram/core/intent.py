@@ -61,13 +61,23 @@ _SEMANTIC_PATTERNS: List[Tuple[re.Pattern, float]] = [
 ]
 
 
+# Single-pass prefilter: queries with no signal at all skip the per-pattern scan.
+_ANY_SIGNAL = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern, _ in _EPISODIC_PATTERNS + _SEMANTIC_PATTERNS),
+    re.I,
+)
+
+
 def classify_intent(query: str) -> QueryIntent:
     """Classify a search query as episodic, semantic, or mixed.
 
     Returns QueryIntent enum based on regex pattern matching.
     Zero LLM cost, sub-millisecond execution.
     """
-    if not query or not query.strip():
+    if not query or query.isspace():
+        return QueryIntent.MIXED
+
+    if not _ANY_SIGNAL.search(query):
         return QueryIntent.MIXED
 
     episodic_score = 0.0
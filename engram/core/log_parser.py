@@ -1,15 +1,30 @@
 """Parse Claude Code .jsonl conversation logs for handoff context recovery.
 
-Stdlib-only — no external dependencies.  Reads the structured JSONL logs that
-Claude Code writes to ``~/.claude/projects/<escaped-path>/<session-id>.jsonl``
-and extracts a handoff-like digest (task summary, files touched, commands run,
-timestamps, etc.).
+Stdlib-only — no external dependencies (``orjson`` is used when installed).
+Reads the structured JSONL logs that Claude Code writes to
+``~/.claude/projects/<escaped-path>/<session-id>.jsonl`` and extracts a
+handoff-like digest (task summary, files touched, commands run, timestamps,
+etc.).
 """
 
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+
+# Tools whose ``input`` carries a file path (``file_path`` or ``path``).
+_FILE_TOOLS = frozenset({"Read", "Write", "Edit", "Glob"})
+
+# Both path separators map to "-" in Claude Code's escaped directory names.
+_PATH_SEPARATORS = str.maketrans({"/": "-", "\\": "-"})
 
 
 def _escape_path(repo_path: str) -> str:
@@ -17,7 +32,7 @@ def _escape_path(repo_path: str) -> str:
 
     ``/Users/foo/bar`` → ``-Users-foo-bar``
     """
-    return repo_path.replace("/", "-").replace("\\", "-")
+    return repo_path.translate(_PATH_SEPARATORS)
 
 
 def find_latest_log(repo_path: str) -> Optional[str]:
@@ -34,19 +49,22 @@ def find_latest_log(repo_path: str) -> Optional[str]:
     if not log_dir.is_dir():
         return None
 
-    jsonl_files: List[Path] = []
+    # Single scandir pass keeping the running newest; no Path objects or sort.
+    newest_path: Optional[str] = None
+    newest_mtime = 0
     try:
-        for entry in log_dir.iterdir():
-            if entry.suffix == ".jsonl" and entry.is_file():
-                jsonl_files.append(entry)
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if newest_path is None or mtime > newest_mtime:
+                    newest_path = entry.path
+                    newest_mtime = mtime
     except OSError:
         return None
 
-    if not jsonl_files:
-        return None
-
-    jsonl_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return str(jsonl_files[0])
+    return newest_path
 
 
 def parse_conversation_log(jsonl_path: str) -> Dict:
@@ -81,69 +99,47 @@ def parse_conversation_log(jsonl_path: str) -> Dict:
     last_ts: Optional[str] = None
     message_count = 0
 
-    try:
-        with open(jsonl_path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                ts = entry.get("timestamp")
-                msg = entry.get("message", {})
-                role = msg.get("role") or entry.get("type", "")
-                content = msg.get("content", "")
-                message_count += 1
-
-                if first_ts is None and ts:
-                    first_ts = ts
-                if ts:
-                    last_ts = ts
-
-                # --- user messages ---
-                if role == "user":
-                    text = _extract_text(content)
-                    if text:
-                        if first_user is None:
-                            first_user = text
-                        last_user = text
-
-                # --- assistant messages ---
-                elif role == "assistant":
-                    text = _extract_text(content)
-                    if text:
-                        last_assistant_text = text
-
-                    # extract tool_use blocks for files & commands
-                    _extract_tool_artifacts(content, files_touched, key_commands)
+    for line in _iter_log_lines(jsonl_path):
+        try:
+            entry = _loads(line)
+        except ValueError:
+            continue
 
-    except (OSError, IOError):
-        pass
-
-    # deduplicate while preserving order
-    seen_files: set = set()
-    unique_files: List[str] = []
-    for f in files_touched:
-        if f not in seen_files:
-            seen_files.add(f)
-            unique_files.append(f)
-
-    seen_cmds: set = set()
-    unique_cmds: List[str] = []
-    for c in key_commands:
-        if c not in seen_cmds:
-            seen_cmds.add(c)
-            unique_cmds.append(c)
+        ts = entry.get("timestamp")
+        msg = entry.get("message", {})
+        role = msg.get("role") or entry.get("type", "")
+        content = msg.get("content", "")
+        message_count += 1
+
+        if first_ts is None and ts:
+            first_ts = ts
+        if ts:
+            last_ts = ts
+
+        # --- user messages ---
+        if role == "user":
+            text = _extract_text(content)
+            if text:
+                if first_user is None:
+                    first_user = text
+                last_user = text
+
+        # --- assistant messages ---
+        elif role == "assistant":
+            text = _extract_text(content)
+            if text:
+                last_assistant_text = text
+
+            # extract tool_use blocks for files & commands
+            _extract_tool_artifacts(content, files_touched, key_commands)
 
     return {
         "task_summary": (first_user or "")[:300],
         "last_user_message": last_user or "",
         "last_assistant_summary": (last_assistant_text or "")[:500],
-        "files_touched": unique_files,
-        "key_commands": unique_cmds,
+        # dict.fromkeys deduplicates while preserving first-seen order
+        "files_touched": list(dict.fromkeys(files_touched)),
+        "key_commands": list(dict.fromkeys(key_commands)),
         "message_count": message_count,
         "started_at": first_ts,
         "ended_at": last_ts,
@@ -151,6 +147,17 @@ def parse_conversation_log(jsonl_path: str) -> Dict:
     }
 
 
+def _iter_log_lines(jsonl_path: str) -> Iterator[bytes]:
+    """Yield non-blank raw lines, streaming so only one entry is resident."""
+    try:
+        with open(jsonl_path, "rb") as fh:
+            for line in fh:
+                if line.strip():
+                    yield line
+    except (OSError, IOError):
+        return
+
+
 def _extract_text(content) -> Optional[str]:
     """Pull plain text from a message ``content`` field.
 
@@ -177,21 +184,22 @@ def _extract_tool_artifacts(
     """Scan ``content`` blocks for tool_use and collect file paths / commands."""
     if not isinstance(content, list):
         return
+    file_tools = _FILE_TOOLS
+    files_append = files_out.append
+    cmds_append = cmds_out.append
     for block in content:
         if not isinstance(block, dict) or block.get("type") != "tool_use":
             continue
-        name = block.get("name", "")
-        inp = block.get("input", {})
-        if not isinstance(inp, dict):
-            continue
-
-        # file-touching tools
-        if name in ("Read", "Write", "Edit", "Glob"):
-            fp = inp.get("file_path") or inp.get("path") or ""
-            if fp:
-                files_out.append(fp)
-        # Bash commands
+        name = block.get("name")
+        if name in file_tools:
+            inp = block.get("input")
+            if isinstance(inp, dict):
+                fp = inp.get("file_path") or inp.get("path")
+                if fp:
+                    files_append(fp)
         elif name == "Bash":
-            cmd = inp.get("command", "")
-            if cmd:
-                cmds_out.append(cmd)
+            inp = block.get("input")
+            if isinstance(inp, dict):
+                cmd = inp.get("command")
+                if cmd:
+                    cmds_append(cmd)
@@ -42,6 +42,11 @@ _SELF_PATTERNS = [
     re.compile(r"\bcall me\b", re.IGNORECASE),
 ]
 
+# All self-reference patterns in one alternation: a single scan per content.
+_SELF_UNION_PATTERN = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in _SELF_PATTERNS), re.IGNORECASE
+)
+
 # Patterns for third-person mentions
 _PERSON_PATTERN = re.compile(
     r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b"  # Two+ capitalized words = likely a name
@@ -97,7 +102,7 @@ class ProfileProcessor:
         updates: List[ProfileUpdate] = []
 
         # Self-profile updates
-        is_self_ref = any(p.search(content) for p in _SELF_PATTERNS)
+        is_self_ref = _SELF_UNION_PATTERN.search(content) is not None
         if is_self_ref:
             update = ProfileUpdate(
                 profile_name="self",
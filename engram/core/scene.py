@@ -105,19 +105,7 @@ class SceneProcessor:
         if len(memory_ids) >= self.max_scene_memories:
             return SceneDetectionResult(is_new_scene=True, reason="max_memories")
 
-        # 3. Topic shift (cosine similarity)
-        scene_embedding = current_scene.get("embedding")
-        topic_sim: Optional[float] = None
-        if embedding and scene_embedding:
-            topic_sim = _cosine_similarity(embedding, scene_embedding)
-            if topic_sim < self.topic_threshold:
-                return SceneDetectionResult(
-                    is_new_scene=True,
-                    reason="topic_shift",
-                    topic_similarity=topic_sim,
-                )
-
-        # 4. Location change
+        # 3. Location change
         scene_location = current_scene.get("location")
         detected_location = _detect_location(content)
         if (
@@ -131,6 +119,18 @@ class SceneProcessor:
                 detected_location=detected_location,
             )
 
+        # 4. Topic shift (cosine similarity, O(d) so checked last)
+        scene_embedding = current_scene.get("embedding")
+        topic_sim: Optional[float] = None
+        if embedding and scene_embedding:
+            topic_sim = _cosine_similarity(embedding, scene_embedding)
+            if topic_sim < self.topic_threshold:
+                return SceneDetectionResult(
+                    is_new_scene=True,
+                    reason="topic_shift",
+                    topic_similarity=topic_sim,
+                )
+
         return SceneDetectionResult(
             is_new_scene=False,
             detected_location=detected_location,
@@ -205,17 +205,19 @@ class SceneProcessor:
             if len(old_emb) == len(embedding):
                 n = max(position, 1)
                 inv = 1.0 / (n + 1)
+                keep = n * inv
                 updates["embedding"] = [
-                    old_emb[i] * (n * inv) + embedding[i] * inv
-                    for i in range(len(embedding))
+                    old * keep + new * inv for old, new in zip(old_emb, embedding)
                 ]
 
-        self.db.update_scene(scene_id, updates)
-        self.db.add_scene_memory(scene_id, memory_id, position=position)
-        try:
-            self.db.update_memory(memory_id, {"scene_id": scene_id})
-        except Exception:
-            pass
+        # Scene row, junction row and memory back-reference commit together.
+        with self.db.transaction():
+            self.db.update_scene(scene_id, updates)
+            self.db.add_scene_memory(scene_id, memory_id, position=position)
+            try:
+                self.db.update_memory(memory_id, {"scene_id": scene_id})
+            except Exception:
+                pass
 
     def close_scene(self, scene_id: str, timestamp: Optional[str] = None) -> None:
         """Close a scene: set end_time and generate summary."""
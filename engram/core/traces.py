@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import math
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from engram.configs.base import DistillationConfig
@@ -47,6 +47,19 @@ def compute_effective_strength(
     return max(0.0, min(1.0, effective))
 
 
+def compute_effective_strength_batch(
+    traces: List[Tuple[float, float, float]], config: "DistillationConfig"
+) -> List[float]:
+    """Batch version of compute_effective_strength (weights read once)."""
+    w_fast = config.s_fast_weight
+    w_mid = config.s_mid_weight
+    w_slow = config.s_slow_weight
+    return [
+        max(0.0, min(1.0, w_fast * sf + w_mid * sm + w_slow * ss))
+        for sf, sm, ss in traces
+    ]
+
+
 def decay_traces(
     s_fast: float,
     s_mid: float,
@@ -54,19 +67,25 @@ def decay_traces(
     last_accessed: datetime,
     access_count: int,
     config: "DistillationConfig",
+    now: Optional[datetime] = None,
 ) -> Tuple[float, float, float]:
-    """Decay each trace independently at its own rate."""
+    """Decay each trace independently at its own rate.
+
+    Sweeps pass ``now`` so every memory is measured against one clock reading.
+    """
     if isinstance(last_accessed, str):
         last_accessed = datetime.fromisoformat(last_accessed)
     if last_accessed.tzinfo is None:
         last_accessed = last_accessed.replace(tzinfo=timezone.utc)
 
-    elapsed_days = (datetime.now(timezone.utc) - last_accessed).total_seconds() / 86400.0
-    dampening = 1.0 + 0.5 * math.log1p(access_count)
+    now = now or datetime.now(timezone.utc)
+    elapsed_days = (now - last_accessed).total_seconds() / 86400.0
+    # Decay exponent per unit rate: elapsed time slowed by access dampening.
+    scaled_days = elapsed_days / (1.0 + 0.5 * math.log1p(access_count))
 
-    new_fast = s_fast * math.exp(-config.s_fast_decay_rate * elapsed_days / dampening)
-    new_mid = s_mid * math.exp(-config.s_mid_decay_rate * elapsed_days / dampening)
-    new_slow = s_slow * math.exp(-config.s_slow_decay_rate * elapsed_days / dampening)
+    new_fast = s_fast * math.exp(-config.s_fast_decay_rate * scaled_days)
+    new_mid = s_mid * math.exp(-config.s_mid_decay_rate * scaled_days)
+    new_slow = s_slow * math.exp(-config.s_slow_decay_rate * scaled_days)
 
     return (
         max(0.0, min(1.0, new_fast)),
@@ -91,14 +110,19 @@ def decay_traces_batch(
             config.s_mid_decay_rate,
             config.s_slow_decay_rate,
         )
-    # Python fallback
+    # Python fallback: config rates and math functions bound once for the loop.
+    exp = math.exp
+    log1p = math.log1p
+    neg_fast = -config.s_fast_decay_rate
+    neg_mid = -config.s_mid_decay_rate
+    neg_slow = -config.s_slow_decay_rate
     results = []
     for (sf, sm, ss), ed, ac in zip(traces, elapsed_days, access_counts):
-        dampening = 1.0 + 0.5 * math.log1p(ac)
+        scaled = ed / (1.0 + 0.5 * log1p(ac))
         results.append((
-            max(0.0, min(1.0, sf * math.exp(-config.s_fast_decay_rate * ed / dampening))),
-            max(0.0, min(1.0, sm * math.exp(-config.s_mid_decay_rate * ed / dampening))),
-            max(0.0, min(1.0, ss * math.exp(-config.s_slow_decay_rate * ed / dampening))),
+            max(0.0, min(1.0, sf * exp(neg_fast * scaled))),
+            max(0.0, min(1.0, sm * exp(neg_mid * scaled))),
+            max(0.0, min(1.0, ss * exp(neg_slow * scaled))),
         ))
     return results
 
@@ -129,6 +153,27 @@ def cascade_traces(
     )
 
 
+def cascade_traces_batch(
+    traces: List[Tuple[float, float, float]],
+    config: "DistillationConfig",
+    deep_sleep: bool = False,
+) -> List[Tuple[float, float, float]]:
+    """Batch version of cascade_traces (coefficients read once)."""
+    fast_to_mid = config.cascade_fast_to_mid
+    mid_to_slow = config.cascade_mid_to_slow if deep_sleep else 0.0
+    results = []
+    for sf, sm, ss in traces:
+        moved = sf * fast_to_mid
+        new_mid = sm + moved
+        settled = new_mid * mid_to_slow
+        results.append((
+            max(0.0, min(1.0, sf - moved)),
+            max(0.0, min(1.0, new_mid - settled)),
+            max(0.0, min(1.0, ss + settled)),
+        ))
+    return results
+
+
 def boost_fast_trace(s_fast: float, boost: float) -> float:
     """On access, only the fast trace gets boosted (not mid/slow)."""
     return max(0.0, min(1.0, s_fast + boost))
@@ -1,12 +1,17 @@
 import json
 import logging
 import os
+import queue
+import re
 import sqlite3
 import threading
+import time
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
@@ -34,36 +39,197 @@ VALID_PROFILE_COLUMNS = frozenset({
 })
 
 
+# Stay under SQLITE_MAX_VARIABLE_NUMBER (999 on builds before 3.32) for IN lists.
+_MAX_SQL_VARS = 900
+
+# Metadata keys allowed in json_extract paths (they are interpolated into SQL).
+_METADATA_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Value of a top-level metadata key, or NULL when the row's metadata is not
+# valid JSON (json_extract would raise instead). Filters and the task
+# indexes must use this exact expression for the planner to match them.
+_METADATA_VALUE_SQL = "CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.{key}') END"
+
+# Partial expression indexes (task rows only) for the metadata fields task
+# queries filter on, keyed by migration version. They replace the earlier
+# full-table indexes of the same name, which json_extract'ed every row.
+_TASK_INDEX_MIGRATIONS: Dict[str, Tuple[str, str]] = {
+    "v2_task_project_partial_index": ("idx_memories_task_project", "task_project_id"),
+    "v2_task_status_partial_index": ("idx_memories_task_status", "task_status"),
+    "v2_task_parent_partial_index": ("idx_memories_task_parent", "task_parent_id"),
+}
+
+# Hot statements shared by the single-row and batch paths, so both hit the
+# same entry in the connection's prepared-statement cache.
+_SQL_INSERT_MEMORY = """
+    INSERT INTO memories (
+        id, memory, user_id, agent_id, run_id, app_id,
+        metadata, categories, immutable, expiration_date,
+        created_at, updated_at, layer, strength, access_count,
+        last_accessed, embedding, related_memories, source_memories, tombstone,
+        confidentiality_scope, namespace, source_type, source_app, source_event_id, decay_lambda,
+        status, importance, sensitivity,
+        memory_type, s_fast, s_mid, s_slow
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_HISTORY = """
+    INSERT INTO memory_history (
+        memory_id, event, old_value, new_value,
+        old_strength, new_strength, old_layer, new_layer
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Connection pragmas, applied once per connection by _configure_connection.
+_PRAGMAS_WAL = "PRAGMA journal_mode=WAL; PRAGMA wal_autocheckpoint=1000;"
+_PRAGMAS_FAST = (
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA cache_size=-64000;"  # 64MB cache
+    "PRAGMA mmap_size=268435456;"  # 256MB
+    "PRAGMA temp_store=MEMORY;"
+)
+_PRAGMAS_DURABLE = (
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA synchronous=FULL;"
+    "PRAGMA cache_size=-8000;"  # 8MB cache
+    "PRAGMA temp_store=MEMORY;"
+)
+
+
+# Columns stored as JSON text, serialized on update.
+_MEMORY_JSON_COLUMNS = frozenset({"metadata", "categories", "embedding", "related_memories", "source_memories"})
+_SCENE_JSON_COLUMNS = frozenset({"participants", "memory_ids", "embedding"})
+_PROFILE_JSON_COLUMNS = frozenset({"facts", "preferences", "relationships", "aliases", "theory_of_mind", "embedding"})
+
+_UPDATABLE_TABLES = {
+    "memories": (VALID_MEMORY_COLUMNS, "memory"),
+    "scenes": (VALID_SCENE_COLUMNS, "scene"),
+    "profiles": (VALID_PROFILE_COLUMNS, "profile"),
+}
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table: str, columns: Tuple[str, ...], touch_updated_at: bool) -> str:
+    """Build (once per column set) a validated ``UPDATE ... WHERE id = ?`` statement."""
+    valid, label = _UPDATABLE_TABLES[table]
+    for column in columns:
+        if column not in valid:
+            raise ValueError(f"Invalid {label} column: {column!r}")
+    set_clauses = [f"{column} = ?" for column in columns]
+    if touch_updated_at:
+        set_clauses.append("updated_at = ?")
+    return f"UPDATE {table} SET {', '.join(set_clauses)} WHERE id = ?"
+
+
 def _utcnow() -> datetime:
     """Return current UTC datetime (timezone-aware)."""
     return datetime.now(timezone.utc)
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted. Swapped
+# as one tuple so concurrent callers never pair a stale prefix with a new second.
+_iso_second_cache = (-1, "")
+
+
 def _utcnow_iso() -> str:
-    """Return current UTC time as ISO string."""
-    return _utcnow().isoformat()
+    """Return current UTC time as ISO string (``...T12:00:00.123456+00:00``)."""
+    global _iso_second_cache
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached = _iso_second_cache
+    if cached[0] != sec:
+        cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+        _iso_second_cache = cached
+    return f"{cached[1]}.{rem // 1000:06d}+00:00"
 
 
 class SQLiteManager:
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        fast: Optional[bool] = None,
+        read_pool: Optional[bool] = None,
+    ):
+        """Open (and migrate) the database at *db_path*.
+
+        ``fast=True`` trades durability on power loss for throughput
+        (``synchronous=NORMAL``, larger page cache, memory-mapped I/O); meant
+        for tests and other throwaway databases. When ``fast`` is not given,
+        ``ENGRAM_SQLITE_FAST=1`` in the environment turns it on.
+
+        ``read_pool=True`` (or ``ENGRAM_SQLITE_READ_POOL=1``) serves point
+        reads of a file-backed database from a pool of read-only connections
+        instead of the writer. Off by default.
+        """
         self.db_path = db_path
-        db_dir = os.path.dirname(db_path)
+        # "file:" URIs (e.g. file:name?mode=memory&cache=shared) are passed through.
+        is_uri = db_path.startswith("file:")
+        db_dir = "" if is_uri else os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
         # Phase 1: Persistent connection with WAL mode.
-        self._conn = sqlite3.connect(db_path, check_same_thread=False)
-        self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("PRAGMA busy_timeout=5000")
-        self._conn.execute("PRAGMA synchronous=FULL")
-        self._conn.execute("PRAGMA cache_size=-8000")  # 8MB cache
-        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, uri=is_uri, cached_statements=256,
+        )
+        # In-memory databases have no journal file; WAL does not apply.
+        in_memory = db_path == ":memory:" or (is_uri and "mode=memory" in db_path)
+        self._configure_connection(fast, wal=not in_memory)
+        if read_pool is None:
+            read_pool = os.environ.get("ENGRAM_SQLITE_READ_POOL") == "1"
+        if read_pool and not is_uri and not in_memory:
+            # Read-only connections, opened on demand, let point reads run in
+            # parallel with each other and with the writer (WAL).
+            self._read_pool = queue.SimpleQueue()
+        self._init_db()
+
+    @classmethod
+    def from_connection(
+        cls,
+        conn: sqlite3.Connection,
+        db_path: str = ":memory:",
+        fast: Optional[bool] = None,
+    ) -> "SQLiteManager":
+        """Wrap a connection whose database already has the full schema.
+
+        Skips schema creation and migrations, e.g. for an in-memory copy made
+        with ``template_conn.backup(conn)``. *conn* must have been opened with
+        ``check_same_thread=False``.
+        """
+        self = cls.__new__(cls)
+        self.db_path = db_path
+        self._conn = conn
+        self._configure_connection(fast, wal=False)
+        return self
+
+    def _configure_connection(self, fast: Optional[bool], wal: bool) -> None:
+        if fast is None:
+            fast = os.environ.get("ENGRAM_SQLITE_FAST") == "1"
+        self._fast = fast
+        pragmas = [_PRAGMAS_WAL] if wal else []
+        pragmas.append(_PRAGMAS_FAST if fast else _PRAGMAS_DURABLE)
+        # One script for the whole block; runs once per connection.
+        self._conn.executescript("".join(pragmas))
         self._conn.row_factory = sqlite3.Row
+        self._read_pool: Optional[queue.SimpleQueue] = None
         self._lock = threading.RLock()
-        self._init_db()
+        self._tx_depth = 0
+        self._applied_migrations: Optional[set] = None
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"file:{quote(os.path.abspath(self.db_path))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        conn.executescript((_PRAGMAS_FAST if self._fast else _PRAGMAS_DURABLE) + "PRAGMA query_only=1;")
+        conn.row_factory = sqlite3.Row
+        return conn
 
     def close(self) -> None:
         """Close the persistent connection for clean shutdown."""
         with self._lock:
+            pool, self._read_pool = self._read_pool, None
+            while pool is not None and not pool.empty():
+                try:
+                    pool.get_nowait().close()
+                except Exception:
+                    pass
             if self._conn:
                 try:
                     self._conn.close()
@@ -226,15 +392,76 @@ class SQLiteManager:
 
     @contextmanager
     def _get_connection(self):
-        """Yield the persistent connection under the thread lock."""
+        """Yield the persistent connection under the thread lock.
+
+        Commits on exit unless an enclosing :meth:`transaction` owns the commit.
+        """
         with self._lock:
             try:
                 yield self._conn
-                self._conn.commit()
+                if not self._tx_depth:
+                    self._conn.commit()
             except Exception:
-                self._conn.rollback()
+                if not self._tx_depth:
+                    self._conn.rollback()
                 raise
 
+    @contextmanager
+    def _get_read_connection(self):
+        """Yield a connection for a read-only query.
+
+        With ``read_pool`` on, file-backed databases hand out pooled ``mode=ro``
+        connections so reads do not queue behind the writer lock. While this
+        thread's writer has uncommitted changes (inside :meth:`transaction` or
+        a ``_get_connection`` block) the read goes through the writer instead,
+        so it sees those changes.
+        """
+        pool = self._read_pool
+        use_writer = pool is None
+        if not use_writer and self._lock.acquire(blocking=False):
+            # Re-entrant, so this succeeds if this thread owns the writer.
+            # Failing means another thread does; its pending writes are not
+            # ours to see.
+            try:
+                use_writer = self._conn.in_transaction
+            finally:
+                self._lock.release()
+        if use_writer:
+            with self._get_connection() as conn:
+                yield conn
+            return
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        try:
+            yield conn
+        finally:
+            if self._read_pool is pool:
+                pool.put(conn)
+            else:  # closed while the read was running
+                conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Group several operations into a single commit (re-entrant).
+
+        Holds the thread lock for the whole block; the outermost block commits
+        on success and rolls back everything if an exception escapes.
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._tx_depth -= 1
+                if not self._tx_depth:
+                    self._conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if not self._tx_depth:
+                self._conn.commit()
+
     def _ensure_v2_schema(self, conn: sqlite3.Connection) -> None:
         """Create and migrate Engram v2 schema in-place (idempotent)."""
         conn.execute(
@@ -275,15 +502,13 @@ class SQLiteManager:
         for version, ddl in migrations.items():
             if not self._is_migration_applied(conn, version):
                 conn.executescript(ddl)
-                conn.execute(
-                    "INSERT OR IGNORE INTO schema_migrations (version) VALUES (?)",
-                    (version,),
-                )
+                self._record_migration(conn, version)
 
         # Phase 3: Skip column migrations + backfills if already complete.
         if self._is_migration_applied(conn, "v2_columns_complete"):
             # CLS Distillation Memory columns (idempotent).
             self._ensure_cls_columns(conn)
+            self._ensure_task_indexes(conn)
             return
 
         # v2 columns on existing canonical tables.
@@ -377,12 +602,11 @@ class SQLiteManager:
         )
 
         # Phase 3: Mark column migrations + backfills as complete.
-        conn.execute(
-            "INSERT OR IGNORE INTO schema_migrations (version) VALUES ('v2_columns_complete')"
-        )
+        self._record_migration(conn, "v2_columns_complete")
 
         # CLS Distillation Memory columns (idempotent).
         self._ensure_cls_columns(conn)
+        self._ensure_task_indexes(conn)
 
     def _ensure_cls_columns(self, conn: sqlite3.Connection) -> None:
         """Add CLS Distillation Memory columns to memories table (idempotent)."""
@@ -403,16 +627,34 @@ class SQLiteManager:
             "UPDATE memories SET memory_type = 'semantic' WHERE memory_type IS NULL"
         )
 
-        conn.execute(
-            "INSERT OR IGNORE INTO schema_migrations (version) VALUES ('v2_cls_columns_complete')"
-        )
+        self._record_migration(conn, "v2_cls_columns_complete")
+
+    def _ensure_task_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create the task metadata expression indexes (idempotent)."""
+        for version, (index, key) in _TASK_INDEX_MIGRATIONS.items():
+            if not self._is_migration_applied(conn, version):
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+                conn.execute(
+                    f"CREATE INDEX {index} ON memories("
+                    f"user_id, {_METADATA_VALUE_SQL.format(key=key)}) WHERE memory_type = 'task'"
+                )
+                self._record_migration(conn, version)
 
     def _is_migration_applied(self, conn: sqlite3.Connection, version: str) -> bool:
-        row = conn.execute(
-            "SELECT 1 FROM schema_migrations WHERE version = ?",
+        # One SELECT loads every applied version; later checks hit the set.
+        if self._applied_migrations is None:
+            self._applied_migrations = {
+                row[0] for row in conn.execute("SELECT version FROM schema_migrations")
+            }
+        return version in self._applied_migrations
+
+    def _record_migration(self, conn: sqlite3.Connection, version: str) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations (version) VALUES (?)",
             (version,),
-        ).fetchone()
-        return row is not None
+        )
+        if self._applied_migrations is not None:
+            self._applied_migrations.add(version)
 
     # Phase 5: Allowed table names for ALTER TABLE to prevent SQL injection.
     _ALLOWED_TABLES = frozenset({
@@ -445,17 +687,7 @@ class SQLiteManager:
 
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO memories (
-                    id, memory, user_id, agent_id, run_id, app_id,
-                    metadata, categories, immutable, expiration_date,
-                    created_at, updated_at, layer, strength, access_count,
-                    last_accessed, embedding, related_memories, source_memories, tombstone,
-                    confidentiality_scope, namespace, source_type, source_app, source_event_id, decay_lambda,
-                    status, importance, sensitivity,
-                    memory_type, s_fast, s_mid, s_slow
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_MEMORY,
                 (
                     memory_id,
                     memory_data.get("memory", ""),
@@ -495,12 +727,7 @@ class SQLiteManager:
 
             # Log within the same transaction -- atomic with the insert.
             conn.execute(
-                """
-                INSERT INTO memory_history (
-                    memory_id, event, old_value, new_value,
-                    old_strength, new_strength, old_layer, new_layer
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_HISTORY,
                 (memory_id, "ADD", None, memory_data.get("memory"), None, None, None, None),
             )
 
@@ -565,26 +792,11 @@ class SQLiteManager:
 
         with self._get_connection() as conn:
             conn.executemany(
-                """
-                INSERT INTO memories (
-                    id, memory, user_id, agent_id, run_id, app_id,
-                    metadata, categories, immutable, expiration_date,
-                    created_at, updated_at, layer, strength, access_count,
-                    last_accessed, embedding, related_memories, source_memories, tombstone,
-                    confidentiality_scope, namespace, source_type, source_app, source_event_id, decay_lambda,
-                    status, importance, sensitivity,
-                    memory_type, s_fast, s_mid, s_slow
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_MEMORY,
                 insert_rows,
             )
             conn.executemany(
-                """
-                INSERT INTO memory_history (
-                    memory_id, event, old_value, new_value,
-                    old_strength, new_strength, old_layer, new_layer
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_HISTORY,
                 history_rows,
             )
 
@@ -596,7 +808,7 @@ class SQLiteManager:
         if not include_tombstoned:
             query += " AND tombstone = 0"
 
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             row = conn.execute(query, params).fetchone()
             if row:
                 return self._row_to_dict(row)
@@ -637,8 +849,8 @@ class SQLiteManager:
                 return self._row_to_dict(row)
         return None
 
-    def get_all_memories(
-        self,
+    @staticmethod
+    def _memory_filter_sql(
         *,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
@@ -651,42 +863,98 @@ class SQLiteManager:
         include_tombstoned: bool = False,
         created_after: Optional[str] = None,
         created_before: Optional[str] = None,
-        limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        query = "SELECT * FROM memories WHERE strength >= ?"
+        metadata_filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause and params shared by get_all_memories and count_memories.
+
+        ``metadata_filters`` maps top-level metadata keys to a value (equality)
+        or a list/tuple/set of values (``IN``). ``None``, alone or in a list,
+        matches rows where the key is missing. Rows whose metadata is not
+        valid JSON only match ``None``.
+        """
+        where = "WHERE strength >= ?"
         params: List[Any] = [min_strength]
 
         if not include_tombstoned:
-            query += " AND tombstone = 0"
+            where += " AND tombstone = 0"
         if memory_type:
-            query += " AND memory_type = ?"
+            where += " AND memory_type = ?"
             params.append(memory_type)
         if user_id:
-            query += " AND user_id = ?"
+            where += " AND user_id = ?"
             params.append(user_id)
         if agent_id:
-            query += " AND agent_id = ?"
+            where += " AND agent_id = ?"
             params.append(agent_id)
         if run_id:
-            query += " AND run_id = ?"
+            where += " AND run_id = ?"
             params.append(run_id)
         if app_id:
-            query += " AND app_id = ?"
+            where += " AND app_id = ?"
             params.append(app_id)
         if layer:
-            query += " AND layer = ?"
+            where += " AND layer = ?"
             params.append(layer)
         if namespace:
-            query += " AND namespace = ?"
+            where += " AND namespace = ?"
             params.append(namespace)
         if created_after:
-            query += " AND created_at >= ?"
+            where += " AND created_at >= ?"
             params.append(created_after)
         if created_before:
-            query += " AND created_at <= ?"
+            where += " AND created_at <= ?"
             params.append(created_before)
+        for key, value in (metadata_filters or {}).items():
+            if not _METADATA_KEY_RE.match(key):
+                raise ValueError(f"Invalid metadata filter key: {key!r}")
+            expr = _METADATA_VALUE_SQL.format(key=key)
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = [v for v in value if v is not None]
+                placeholders = ",".join("?" * len(values))
+                clause = f"{expr} IN ({placeholders})"
+                if len(values) < len(value):
+                    clause = f"({clause} OR {expr} IS NULL)"
+                where += f" AND {clause}"
+                params.extend(values)
+            elif value is None:
+                where += f" AND {expr} IS NULL"
+            else:
+                where += f" AND {expr} = ?"
+                params.append(value)
+        return where, params
 
-        query += " ORDER BY strength DESC"
+    def get_all_memories(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        layer: Optional[str] = None,
+        namespace: Optional[str] = None,
+        memory_type: Optional[str] = None,
+        min_strength: float = 0.0,
+        include_tombstoned: bool = False,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        where, params = self._memory_filter_sql(
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            app_id=app_id,
+            layer=layer,
+            namespace=namespace,
+            memory_type=memory_type,
+            min_strength=min_strength,
+            include_tombstoned=include_tombstoned,
+            created_after=created_after,
+            created_before=created_before,
+            metadata_filters=metadata_filters,
+        )
+        query = f"SELECT * FROM memories {where} ORDER BY strength DESC"
 
         # Apply SQL-level LIMIT to avoid fetching unbounded rows into memory.
         if limit is not None and limit > 0:
@@ -697,18 +965,19 @@ class SQLiteManager:
             rows = conn.execute(query, params).fetchall()
             return [self._row_to_dict(row) for row in rows]
 
-    def update_memory(self, memory_id: str, updates: Dict[str, Any]) -> bool:
-        set_clauses = []
-        params: List[Any] = []
-        for key, value in updates.items():
-            if key not in VALID_MEMORY_COLUMNS:
-                raise ValueError(f"Invalid memory column: {key!r}")
-            if key in {"metadata", "categories", "embedding", "related_memories", "source_memories"}:
-                value = json.dumps(value)
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
+    def count_memories(self, **filters: Any) -> int:
+        """Count memories matching the keyword filters of :meth:`get_all_memories`
+        (everything except ``limit``) without building row dicts."""
+        where, params = self._memory_filter_sql(**filters)
+        with self._get_connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM memories {where}", params).fetchone()[0]
 
-        set_clauses.append("updated_at = ?")
+    def update_memory(self, memory_id: str, updates: Dict[str, Any]) -> bool:
+        sql = _update_sql("memories", tuple(updates), True)
+        params: List[Any] = [
+            json.dumps(value) if key in _MEMORY_JSON_COLUMNS else value
+            for key, value in updates.items()
+        ]
         params.append(_utcnow_iso())
         params.append(memory_id)
 
@@ -721,19 +990,11 @@ class SQLiteManager:
             if not old_row:
                 return False
 
-            conn.execute(
-                f"UPDATE memories SET {', '.join(set_clauses)} WHERE id = ?",
-                params,
-            )
+            conn.execute(sql, params)
 
             # Log within the same transaction.
             conn.execute(
-                """
-                INSERT INTO memory_history (
-                    memory_id, event, old_value, new_value,
-                    old_strength, new_strength, old_layer, new_layer
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_HISTORY,
                 (
                     memory_id,
                     "UPDATE",
@@ -767,35 +1028,95 @@ class SQLiteManager:
                 (now, memory_id),
             )
 
+    def increment_metadata_counter(self, memory_id: str, key: str) -> Optional[int]:
+        """Atomically add 1 to integer ``metadata[key]`` (missing counts as 0).
+
+        Returns the new value, or ``None`` if the memory does not exist.
+        Malformed metadata is replaced by ``{key: 1}``. The update, its
+        history row and the read-back share one transaction under the lock,
+        so concurrent callers never observe the same value.
+        """
+        path = f"$.{key}"
+        with self._get_connection() as conn:
+            old_row = conn.execute(
+                "SELECT memory, strength, layer FROM memories WHERE id = ? AND tombstone = 0",
+                (memory_id,),
+            ).fetchone()
+            if not old_row:
+                return None
+            conn.execute(
+                """
+                UPDATE memories
+                SET metadata = json_set(
+                        CASE WHEN json_valid(metadata) THEN metadata ELSE '{}' END,
+                        ?,
+                        COALESCE(json_extract(
+                            CASE WHEN json_valid(metadata) THEN metadata ELSE '{}' END, ?
+                        ), 0) + 1
+                    ),
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (path, path, _utcnow_iso(), memory_id),
+            )
+            conn.execute(
+                _SQL_INSERT_HISTORY,
+                (
+                    memory_id,
+                    "UPDATE",
+                    old_row["memory"],
+                    None,
+                    old_row["strength"],
+                    None,
+                    old_row["layer"],
+                    None,
+                ),
+            )
+            row = conn.execute(
+                "SELECT json_extract(metadata, ?) FROM memories WHERE id = ?",
+                (path, memory_id),
+            ).fetchone()
+            return int(row[0])
+
     # Phase 2: Batch operations to eliminate N+1 queries in search.
 
     def get_memories_bulk(self, memory_ids: List[str], include_tombstoned: bool = False) -> Dict[str, Dict[str, Any]]:
         """Fetch multiple memories by ID in a single query. Returns {id: memory_dict}."""
         if not memory_ids:
             return {}
-        with self._get_connection() as conn:
-            placeholders = ",".join("?" for _ in memory_ids)
-            query = f"SELECT * FROM memories WHERE id IN ({placeholders})"
-            if not include_tombstoned:
-                query += " AND tombstone = 0"
-            rows = conn.execute(query, memory_ids).fetchall()
-            return {row["id"]: self._row_to_dict(row) for row in rows}
+        memory_ids = list(memory_ids)
+        tombstone_clause = "" if include_tombstoned else " AND tombstone = 0"
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._get_read_connection() as conn:
+            for start in range(0, len(memory_ids), _MAX_SQL_VARS):
+                chunk = memory_ids[start:start + _MAX_SQL_VARS]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(
+                    f"SELECT * FROM memories WHERE id IN ({placeholders}){tombstone_clause}",
+                    chunk,
+                ):
+                    result[row["id"]] = self._row_to_dict(row)
+        return result
 
     def increment_access_bulk(self, memory_ids: List[str]) -> None:
         """Increment access count for multiple memories in a single transaction."""
         if not memory_ids:
             return
         now = _utcnow_iso()
+        memory_ids = list(memory_ids)
         with self._get_connection() as conn:
-            placeholders = ",".join("?" for _ in memory_ids)
-            conn.execute(
-                f"""
-                UPDATE memories
-                SET access_count = access_count + 1, last_accessed = ?
-                WHERE id IN ({placeholders})
-                """,
-                [now] + list(memory_ids),
-            )
+            # One UPDATE per chunk, all committed together by _get_connection.
+            for start in range(0, len(memory_ids), _MAX_SQL_VARS):
+                chunk = memory_ids[start:start + _MAX_SQL_VARS]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(
+                    f"""
+                    UPDATE memories
+                    SET access_count = access_count + 1, last_accessed = ?
+                    WHERE id IN ({placeholders})
+                    """,
+                    [now, *chunk],
+                )
 
     def update_strength_bulk(self, updates: Dict[str, float]) -> None:
         """Batch-update strength for multiple memories. updates = {memory_id: new_strength}."""
@@ -828,12 +1149,7 @@ class SQLiteManager:
     def _log_event(self, memory_id: str, event: str, **kwargs: Any) -> None:
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO memory_history (
-                    memory_id, event, old_value, new_value,
-                    old_strength, new_strength, old_layer, new_layer
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_HISTORY,
                 (
                     memory_id,
                     event,
@@ -1167,23 +1483,16 @@ class SQLiteManager:
         return None
 
     def update_scene(self, scene_id: str, updates: Dict[str, Any]) -> bool:
-        set_clauses = []
-        params: List[Any] = []
-        for key, value in updates.items():
-            if key not in VALID_SCENE_COLUMNS:
-                raise ValueError(f"Invalid scene column: {key!r}")
-            if key in {"participants", "memory_ids", "embedding"}:
-                value = json.dumps(value)
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
-        if not set_clauses:
+        if not updates:
             return False
+        sql = _update_sql("scenes", tuple(updates), False)
+        params: List[Any] = [
+            json.dumps(value) if key in _SCENE_JSON_COLUMNS else value
+            for key, value in updates.items()
+        ]
         params.append(scene_id)
         with self._get_connection() as conn:
-            conn.execute(
-                f"UPDATE scenes SET {', '.join(set_clauses)} WHERE id = ?",
-                params,
-            )
+            conn.execute(sql, params)
         return True
 
     def get_open_scene(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -1314,23 +1623,15 @@ class SQLiteManager:
         return None
 
     def update_profile(self, profile_id: str, updates: Dict[str, Any]) -> bool:
-        set_clauses = []
-        params: List[Any] = []
-        for key, value in updates.items():
-            if key not in VALID_PROFILE_COLUMNS:
-                raise ValueError(f"Invalid profile column: {key!r}")
-            if key in {"facts", "preferences", "relationships", "aliases", "theory_of_mind", "embedding"}:
-                value = json.dumps(value)
-            set_clauses.append(f"{key} = ?")
-            params.append(value)
-        set_clauses.append("updated_at = ?")
+        sql = _update_sql("profiles", tuple(updates), True)
+        params: List[Any] = [
+            json.dumps(value) if key in _PROFILE_JSON_COLUMNS else value
+            for key, value in updates.items()
+        ]
         params.append(_utcnow_iso())
         params.append(profile_id)
         with self._get_connection() as conn:
-            conn.execute(
-                f"UPDATE profiles SET {', '.join(set_clauses)} WHERE id = ?",
-                params,
-            )
+            conn.execute(sql, params)
         return True
 
     def get_all_profiles(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
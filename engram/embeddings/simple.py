@@ -1,27 +1,30 @@
 import hashlib
 import math
+from collections import Counter
+from functools import lru_cache
 from typing import List, Optional
 
 from engram.embeddings.base import BaseEmbedder
 
 
+@lru_cache(maxsize=65536)
+def _token_index(token: str, dims: int) -> int:
+    return int(hashlib.sha256(token.encode()).hexdigest(), 16) % dims
+
+
 class SimpleEmbedder(BaseEmbedder):
     def __init__(self, config: Optional[dict] = None):
         super().__init__(config)
         self.dims = int(self.config.get("embedding_dims", 1536))
 
     def embed(self, text: str, memory_action: Optional[str] = None) -> List[float]:
-        tokens = [t for t in text.lower().split() if t]
-        if not tokens:
-            return [0.0] * self.dims
-
+        counts = Counter(_token_index(t, self.dims) for t in text.lower().split())
         vector = [0.0] * self.dims
-        for token in tokens:
-            digest = hashlib.sha256(token.encode()).hexdigest()
-            idx = int(digest, 16) % self.dims
-            vector[idx] += 1.0
+        if not counts:
+            return vector
 
-        norm = math.sqrt(sum(x * x for x in vector))
-        if norm > 0:
-            vector = [x / norm for x in vector]
+        # Only the hashed buckets are non-zero, so normalise just those.
+        norm = math.sqrt(sum(c * c for c in counts.values()))
+        for idx, count in counts.items():
+            vector[idx] = count / norm
         return vector
@@ -1690,6 +1690,10 @@ class Memory(MemoryBase):
                 "At least one filter is required to delete all memories. Use reset() to clear everything.",
                 error_code="VALIDATION_004",
             )
+        if dry_run and not filters:
+            would_delete = self.db.count_memories(user_id=user_id, agent_id=agent_id, run_id=run_id, app_id=app_id)
+            return {"deleted_count": 0, "would_delete": would_delete, "dry_run": True}
+
         memories = self.db.get_all_memories(user_id=user_id, agent_id=agent_id, run_id=run_id, app_id=app_id)
         if filters:
             memories = [m for m in memories if matches_filters({**m, **m.get("metadata", {})}, filters)]
@@ -1736,6 +1740,10 @@ class Memory(MemoryBase):
         decayed = 0
         forgotten = 0
         promoted = 0
+        # Read once per pass rather than once per memory.
+        ref_aware = feature_enabled("ENGRAM_V2_REF_AWARE_DECAY", default=False)
+        # One clock reading for the whole pass; missing timestamps mean "now".
+        now = datetime.now(timezone.utc)
 
         for memory in memories:
             if memory.get("immutable"):
@@ -1754,7 +1762,6 @@ class Memory(MemoryBase):
                 if _ts in ("inbox", "assigned", "active", "review", "blocked"):
                     continue  # skip decay for active tasks
 
-            ref_aware = feature_enabled("ENGRAM_V2_REF_AWARE_DECAY", default=False)
             ref_state = {"strong": 0, "weak": 0}
             if ref_aware:
                 ref_state = self.db.get_memory_refcount(memory["id"])
@@ -1775,18 +1782,20 @@ class Memory(MemoryBase):
                     s_fast=float(memory.get("s_fast", 0.0)),
                     s_mid=float(memory.get("s_mid", 0.0)),
                     s_slow=float(memory.get("s_slow", 0.0)),
-                    last_accessed=memory.get("last_accessed", datetime.now(timezone.utc).isoformat()),
+                    last_accessed=memory.get("last_accessed") or now,
                     access_count=memory.get("access_count", 0),
                     config=self.distillation_config,
+                    now=now,
                 )
                 new_strength = compute_effective_strength(s_f, s_m, s_s, self.distillation_config)
             else:
                 new_strength = calculate_decayed_strength(
                     current_strength=memory.get("strength", 1.0),
-                    last_accessed=memory.get("last_accessed", datetime.now(timezone.utc).isoformat()),
+                    last_accessed=memory.get("last_accessed") or now,
                     access_count=memory.get("access_count", 0),
                     layer=memory.get("layer", "sml"),
                     config=self.fadem_config,
+                    now=now,
                 )
 
             if ref_aware and int(ref_state.get("weak", 0)) > 0:
@@ -10,6 +10,7 @@ import json
 import logging
 import uuid
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -181,14 +182,8 @@ class ProjectManager:
 
     def next_issue_number(self, project_id: str) -> int:
         """Atomically increment and return the next issue number for a project."""
-        mem = self.memory.get(project_id)
-        if not mem:
-            return 1
-        md = self._parse_metadata(mem)
-        counter = md.get("project_issue_counter", 0) + 1
-        md["project_issue_counter"] = counter
-        self.memory.db.update_memory(project_id, {"metadata": md})
-        return counter
+        counter = self.memory.db.increment_metadata_counter(project_id, "project_issue_counter")
+        return 1 if counter is None else counter
 
     # ------------------------------------------------------------------
     # Statuses (memory_type="project_status")
@@ -240,13 +235,18 @@ class ProjectManager:
                 "hidden": md.get("status_hidden", False),
                 "created_at": md.get("status_created_at", m.get("created_at", "")),
             })
-        statuses.sort(key=lambda s: s["sort_order"])
+        statuses.sort(key=itemgetter("sort_order"))
         return statuses
 
     def update_status(self, status_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         mem = self.memory.get(status_id)
         if not mem:
             return None
+        return self._apply_status_update(status_id, mem, updates)
+
+    def _apply_status_update(
+        self, status_id: str, mem: Dict[str, Any], updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
         md = self._parse_metadata(mem)
         if md.get("memory_type") != "project_status":
             return None
@@ -265,6 +265,9 @@ class ProjectManager:
         if "name" in updates:
             db_updates["memory"] = f"Status: {updates['name']}"
         self.memory.db.update_memory(status_id, db_updates)
+        # Keep *mem* current so a later update to the same status in a bulk
+        # call builds on this one instead of the pre-batch row.
+        mem.update(db_updates)
 
         return {
             "id": status_id,
@@ -287,13 +290,20 @@ class ProjectManager:
         return True
 
     def bulk_update_statuses(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # One read for all statuses, then every write in a single transaction.
+        db = self.memory.db
+        ids = [u["id"] for u in updates if u.get("id")]
+        mems = db.get_memories_bulk(ids)
+        db.increment_access_bulk(list(mems))
         results = []
-        for u in updates:
-            sid = u.pop("id", None)
-            if sid:
-                r = self.update_status(sid, u)
-                if r:
-                    results.append(r)
+        with db.transaction():
+            for u in updates:
+                sid = u.pop("id", None)
+                mem = mems.get(sid) if sid else None
+                if mem:
+                    r = self._apply_status_update(sid, mem, u)
+                    if r:
+                        results.append(r)
         return results
 
     def ensure_default_statuses(self, project_id: str, user_id: str = "default") -> List[Dict[str, Any]]:
@@ -10,7 +10,7 @@ import json
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from engram.configs.base import TaskConfig
 
@@ -25,6 +25,14 @@ ACTIVE_STATUSES = frozenset({
 })
 TASK_PRIORITIES = frozenset({"low", "normal", "medium", "high", "urgent"})
 PRIORITY_ALIASES = {"medium": "medium", "normal": "normal"}  # both accepted
+# Status filter for open (not done/archived) tasks; None keeps legacy tasks
+# with no status, which count as inbox.
+_OPEN_STATUS_FILTER = (*sorted(ACTIVE_STATUSES), None)
+
+
+def _title_key(title: str) -> str:
+    """Dedup key: trimmed, whitespace-collapsed, case-folded title."""
+    return " ".join(title.split()).casefold()
 
 
 class TaskManager:
@@ -66,6 +74,147 @@ class TaskManager:
         if existing:
             return existing
 
+        content, meta, status_cat, now = self._build_task(
+            title,
+            description=description,
+            priority=priority,
+            status=status,
+            assignee=assignee,
+            due_date=due_date,
+            tags=tags,
+            extra_metadata=extra_metadata,
+            project_id=project_id,
+            status_id=status_id,
+            assignee_ids=assignee_ids,
+            tag_ids=tag_ids,
+            start_date=start_date,
+            target_date=target_date,
+            parent_task_id=parent_task_id,
+            sort_order=sort_order,
+            issue_number=issue_number,
+        )
+
+        result = self.memory.add(
+            messages=content,
+            user_id=user_id,
+            categories=[status_cat],
+            metadata=meta,
+            source_app="task-manager",
+            infer=False,
+        )
+
+        # Extract the memory id from add result
+        mem_id = None
+        if isinstance(result, dict):
+            results = result.get("results", [])
+            if results and isinstance(results, list):
+                first = results[0]
+                mem_id = first.get("id") or first.get("memory_id")
+            if not mem_id:
+                mem_id = result.get("id") or result.get("memory_id")
+
+        if not mem_id:
+            logger.warning("Could not extract memory ID from add result: %s", result)
+            return {"error": "Failed to create task", "add_result": result}
+
+        return self._format_task_from_parts(
+            mem_id=mem_id,
+            content=content,
+            title=title,
+            description=description,
+            metadata=meta,
+            categories=[status_cat],
+            strength=1.0,
+            created_at=now,
+        )
+
+    def bulk_create_tasks(
+        self,
+        titles: List[str],
+        *,
+        statuses: List[str] | None = None,
+        user_id: str = "default",
+        project_id: str = "default",
+    ) -> List[Dict[str, Any]]:
+        """Create one task per title in a single transaction.
+
+        ``statuses``, when given, is parallel to ``titles``. Unlike
+        ``create_task`` this skips the title dedup check, so callers must
+        pass titles that are not already open tasks. When the Memory has
+        ``batch.enable_batch`` on, the items also take the batched add path,
+        which skips ``add()``'s per-item near-duplicate, conflict and intent
+        checks.
+
+        Raises ValueError for an empty title or a ``statuses`` list of the
+        wrong length, before anything is written.
+        """
+        if any(not str(title).strip() for title in titles):
+            raise ValueError("Task titles must be non-empty")
+        if statuses is None:
+            statuses = ["inbox"] * len(titles)
+        elif len(statuses) != len(titles):
+            raise ValueError(
+                f"Got {len(statuses)} statuses for {len(titles)} titles"
+            )
+        built = [
+            self._build_task(title, status=status, project_id=project_id)
+            for title, status in zip(titles, statuses)
+        ]
+        items = [
+            {
+                "content": content,
+                "metadata": meta,
+                "categories": [status_cat],
+                "source_app": "task-manager",
+            }
+            for content, meta, status_cat, _ in built
+        ]
+        with self.memory.db.transaction():
+            result = self.memory.add_batch(
+                items, user_id=user_id, source_app="task-manager",
+            )
+
+        tasks = []
+        for title, (content, meta, status_cat, now), r in zip(
+            titles, built, result.get("results", [])
+        ):
+            mem_id = r.get("id") or r.get("memory_id")
+            if not mem_id:
+                continue
+            tasks.append(self._format_task_from_parts(
+                mem_id=mem_id,
+                content=content,
+                title=title,
+                description="",
+                metadata=meta,
+                categories=[status_cat],
+                strength=1.0,
+                created_at=now,
+            ))
+        return tasks
+
+    def _build_task(
+        self,
+        title: str,
+        *,
+        description: str = "",
+        priority: str | None = None,
+        status: str = "inbox",
+        assignee: str | None = None,
+        due_date: str | None = None,
+        tags: List[str] | None = None,
+        extra_metadata: Dict[str, Any] | None = None,
+        project_id: str = "default",
+        status_id: str | None = None,
+        assignee_ids: List[str] | None = None,
+        tag_ids: List[str] | None = None,
+        start_date: str | None = None,
+        target_date: str | None = None,
+        parent_task_id: str | None = None,
+        sort_order: int = 0,
+        issue_number: int | None = None,
+    ) -> Tuple[str, Dict[str, Any], str, str]:
+        """Return ``(content, metadata, status_category, now)`` for a new task."""
         priority = priority or self.config.default_priority
         if priority not in TASK_PRIORITIES:
             priority = "normal"
@@ -101,6 +250,7 @@ class TaskManager:
             "task_relationships": [],
             "task_issue_number": issue_number or 0,
             "task_completed_at": None,
+            "task_title_key": _title_key(title),
         }
         if extra_metadata:
             meta["task_custom"] = extra_metadata
@@ -109,40 +259,7 @@ class TaskManager:
         content = title
         if description:
             content = f"{title}\n{description}"
-
-        result = self.memory.add(
-            messages=content,
-            user_id=user_id,
-            categories=[status_cat],
-            metadata=meta,
-            source_app="task-manager",
-            infer=False,
-        )
-
-        # Extract the memory id from add result
-        mem_id = None
-        if isinstance(result, dict):
-            results = result.get("results", [])
-            if results and isinstance(results, list):
-                first = results[0]
-                mem_id = first.get("id") or first.get("memory_id")
-            if not mem_id:
-                mem_id = result.get("id") or result.get("memory_id")
-
-        if not mem_id:
-            logger.warning("Could not extract memory ID from add result: %s", result)
-            return {"error": "Failed to create task", "add_result": result}
-
-        return self._format_task_from_parts(
-            mem_id=mem_id,
-            content=content,
-            title=title,
-            description=description,
-            metadata=meta,
-            categories=[status_cat],
-            strength=1.0,
-            created_at=now,
-        )
+        return content, meta, status_cat, now
 
     # ------------------------------------------------------------------
     # Read
@@ -168,26 +285,24 @@ class TaskManager:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """List tasks with optional filters."""
+        metadata_filters: Dict[str, Any] = {}
+        if status:
+            metadata_filters["task_status"] = status
+        if priority:
+            metadata_filters["task_priority"] = priority
+        if assignee:
+            metadata_filters["task_assigned_agent"] = assignee
         memories = self.memory.db.get_all_memories(
             user_id=user_id,
             memory_type="task",
-            limit=limit * 3,  # fetch extra for post-filtering
+            metadata_filters=metadata_filters,
+            limit=limit,
         )
-        tasks = []
-        for mem in memories:
-            md = self._parse_metadata(mem)
-            if md.get("memory_type") != "task":
-                continue
-            if status and md.get("task_status") != status:
-                continue
-            if priority and md.get("task_priority") != priority:
-                continue
-            if assignee and md.get("task_assigned_agent") != assignee:
-                continue
-            tasks.append(self._format_task(mem))
-            if len(tasks) >= limit:
-                break
-        return tasks
+        return [
+            self._format_task(mem)
+            for mem in memories
+            if self._parse_metadata(mem).get("memory_type") == "task"
+        ]
 
     def get_pending_tasks(
         self,
@@ -196,23 +311,20 @@ class TaskManager:
         assignee: str | None = None,
     ) -> List[Dict[str, Any]]:
         """Get actionable tasks (not done/archived)."""
+        metadata_filters: Dict[str, Any] = {"task_status": _OPEN_STATUS_FILTER}
+        if assignee:
+            metadata_filters["task_assigned_agent"] = assignee
         memories = self.memory.db.get_all_memories(
             user_id=user_id,
             memory_type="task",
+            metadata_filters=metadata_filters,
             limit=500,
         )
-        tasks = []
-        for mem in memories:
-            md = self._parse_metadata(mem)
-            if md.get("memory_type") != "task":
-                continue
-            ts = md.get("task_status", "inbox")
-            if ts not in ACTIVE_STATUSES:
-                continue
-            if assignee and md.get("task_assigned_agent") != assignee:
-                continue
-            tasks.append(self._format_task(mem))
-        return tasks
+        return [
+            self._format_task(mem)
+            for mem in memories
+            if self._parse_metadata(mem).get("memory_type") == "task"
+        ]
 
     def search_tasks(
         self,
@@ -237,6 +349,32 @@ class TaskManager:
                 break
         return tasks
 
+    def filter_by_title_contains(
+        self,
+        substr: str,
+        *,
+        user_id: str = "default",
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Case-insensitive substring match on task titles (no embedding)."""
+        needle = substr.lower()
+        memories = self.memory.db.get_all_memories(
+            user_id=user_id,
+            memory_type="task",
+            limit=500,
+        )
+        tasks = []
+        for mem in memories:
+            title = mem.get("memory", "").split("\n", 1)[0]
+            if needle not in title.lower():
+                continue
+            if self._parse_metadata(mem).get("memory_type") != "task":
+                continue
+            tasks.append(self._format_task(mem))
+            if len(tasks) >= limit:
+                break
+        return tasks
+
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
@@ -306,6 +444,7 @@ class TaskManager:
             d = new_desc or (parts[1] if len(parts) > 1 else "")
             new_content = f"{t}\n{d}" if d else t
             db_updates["memory"] = new_content
+            new_md["task_title_key"] = _title_key(t)
 
         self.memory.db.update_memory(task_id, db_updates)
         return self.get_task(task_id)
@@ -420,22 +559,21 @@ class TaskManager:
         limit: int = 500,
     ) -> List[Dict[str, Any]]:
         """List tasks belonging to a specific project."""
+        # Project (and status) filters run in SQL on idx_memories_task_project.
+        metadata_filters: Dict[str, Any] = {"task_project_id": project_id}
+        if status_id:
+            metadata_filters["task_status_id"] = status_id
         memories = self.memory.db.get_all_memories(
-            user_id=user_id, memory_type="task", limit=limit * 3,
+            user_id=user_id,
+            memory_type="task",
+            metadata_filters=metadata_filters,
+            limit=limit,
         )
-        tasks = []
-        for mem in memories:
-            md = self._parse_metadata(mem)
-            if md.get("memory_type") != "task":
-                continue
-            if md.get("task_project_id") != project_id:
-                continue
-            if status_id and md.get("task_status_id") != status_id:
-                continue
-            tasks.append(self._format_task(mem))
-            if len(tasks) >= limit:
-                break
-        return tasks
+        return [
+            self._format_task(mem)
+            for mem in memories
+            if self._parse_metadata(mem).get("memory_type") == "task"
+        ]
 
     def add_relationship(
         self, task_id: str, related_id: str, rel_type: str = "related"
@@ -489,16 +627,16 @@ class TaskManager:
     def get_sub_tasks(self, parent_task_id: str, user_id: str = "default") -> List[Dict[str, Any]]:
         """Get all sub-tasks of a parent task."""
         memories = self.memory.db.get_all_memories(
-            user_id=user_id, memory_type="task", limit=500,
+            user_id=user_id,
+            memory_type="task",
+            metadata_filters={"task_parent_id": parent_task_id},
+            limit=500,
         )
-        tasks = []
-        for mem in memories:
-            md = self._parse_metadata(mem)
-            if md.get("memory_type") != "task":
-                continue
-            if md.get("task_parent_id") == parent_task_id:
-                tasks.append(self._format_task(mem))
-        return tasks
+        return [
+            self._format_task(mem)
+            for mem in memories
+            if self._parse_metadata(mem).get("memory_type") == "task"
+        ]
 
     def add_reaction(
         self, task_id: str, comment_id: str, user_id: str, emoji: str
@@ -571,11 +709,29 @@ class TaskManager:
 
     def _dedup_check(self, title: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Case-insensitive title match on non-done/archived tasks."""
-        existing = self.list_tasks(user_id=user_id, limit=500)
-        title_lower = title.strip().lower()
-        for t in existing:
-            if t["title"].strip().lower() == title_lower and t["status"] not in ("done", "archived"):
-                return t
+        key = _title_key(title)
+        db = self.memory.db
+        # Key and status both filter in SQL.
+        matches = db.get_all_memories(
+            user_id=user_id,
+            memory_type="task",
+            metadata_filters={"task_title_key": key, "task_status": _OPEN_STATUS_FILTER},
+            limit=1,
+        )
+        if matches:
+            return self._format_task(matches[0])
+        # Tasks written before the key existed fall back to the content.
+        legacy = db.get_all_memories(
+            user_id=user_id,
+            memory_type="task",
+            metadata_filters={"task_title_key": None, "task_status": _OPEN_STATUS_FILTER},
+            limit=500,
+        )
+        for mem in legacy:
+            if self._parse_metadata(mem).get("memory_type") != "task":
+                continue
+            if _title_key(mem.get("memory", "").split("\n", 1)[0]) == key:
+                return self._format_task(mem)
         return None
 
     # ------------------------------------------------------------------
@@ -9,6 +9,7 @@ Requires engram-accel (Rust) for SIMD-optimized operations.
 from typing import List, Optional
 
 import math as _math
+from operator import mul as _mul
 
 try:
     from engram_accel import (
@@ -19,14 +20,22 @@ try:
 except ImportError:
     ACCEL_AVAILABLE = False
 
+    # Fallback keeps the loops in C: map(mul) for the dot product and
+    # n-dimensional hypot for norms, with the query norm computed once per batch.
     def _rs_cosine(a, b):
-        dot = sum(x * y for x, y in zip(a, b))
-        na = _math.sqrt(sum(x * x for x in a))
-        nb = _math.sqrt(sum(x * x for x in b))
-        return dot / (na * nb) if na and nb else 0.0
+        na = _math.hypot(*a)
+        nb = _math.hypot(*b)
+        return sum(map(_mul, a, b)) / (na * nb) if na and nb else 0.0
 
     def _rs_cosine_batch(query, store):
-        return [_rs_cosine(query, v) for v in store]
+        nq = _math.hypot(*query)
+        if not nq:
+            return [0.0] * len(store)
+        out = []
+        for v in store:
+            nv = _math.hypot(*v)
+            out.append(sum(map(_mul, query, v)) / (nq * nv) if nv else 0.0)
+        return out
 
 
 def _pure_python_cosine(a, b):
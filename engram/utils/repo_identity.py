@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
 import subprocess
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 def _run_git(repo_path: str, args: list[str]) -> Optional[str]:
@@ -41,6 +42,19 @@ def _hash(prefix: str, value: str) -> str:
     return f"{prefix}:{digest[:20]}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_repo_root(resolved_path: str) -> Tuple[str, Optional[str]]:
+    """Return ``(canonical_path, normalized_remote)`` for a resolved path.
+
+    Cached per normalized path so repeated lookups (including aliases such as
+    ``repo/./``) do not shell out to git again.
+    """
+    git_root = _run_git(resolved_path, ["rev-parse", "--show-toplevel"])
+    canonical_path = os.path.realpath(git_root) if git_root else resolved_path
+    git_remote = _normalize_remote(_run_git(canonical_path, ["config", "--get", "remote.origin.url"]))
+    return canonical_path, git_remote
+
+
 def canonicalize_repo_identity(
     repo_path: Optional[str],
     *,
@@ -50,10 +64,7 @@ def canonicalize_repo_identity(
     path_hint = repo_path or os.getcwd()
     resolved_path = os.path.realpath(os.path.expanduser(path_hint))
 
-    git_root = _run_git(resolved_path, ["rev-parse", "--show-toplevel"])
-    canonical_path = os.path.realpath(git_root) if git_root else resolved_path
-
-    git_remote = _normalize_remote(_run_git(canonical_path, ["config", "--get", "remote.origin.url"]))
+    canonical_path, git_remote = _resolve_repo_root(resolved_path)
     git_branch = branch or _run_git(canonical_path, ["rev-parse", "--abbrev-ref", "HEAD"])
     if git_branch == "HEAD":
         git_branch = None
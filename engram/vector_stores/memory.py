@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import threading
 import uuid
 from typing import Any, Dict, List, Optional
@@ -50,12 +51,12 @@ class InMemoryVectorStore(VectorStoreBase):
         store_vectors = [rec.get("vector", []) for _, rec, _ in filtered]
         scores = cosine_similarity_batch(vectors, store_vectors)
 
-        results: List[MemoryResult] = []
-        for (vector_id, _, payload), score in zip(filtered, scores):
-            results.append(MemoryResult(id=vector_id, score=score, payload=payload))
-
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:limit]
+        # Partial top-k selection (O(n log k)); results are built only for the winners.
+        top = heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+        return [
+            MemoryResult(id=filtered[i][0], score=scores[i], payload=filtered[i][2])
+            for i in top
+        ]
 
     def delete(self, vector_id: str) -> None:
         with self._lock:
@@ -11,11 +11,13 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import sqlite3
 import struct
 import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from engram.memory.utils import matches_filters
 from engram.vector_stores.base import MemoryResult, VectorStoreBase
@@ -23,14 +25,38 @@ from engram.vector_stores.base import MemoryResult, VectorStoreBase
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _float32_struct(dims: int) -> struct.Struct:
+    """Precompiled packer for *dims* float32 values (one per vector size)."""
+    return struct.Struct(f"{dims}f")
+
+
 def _serialize_float32(vector: List[float]) -> bytes:
     """Serialize a float vector to bytes for sqlite-vec."""
-    return struct.pack(f"{len(vector)}f", *vector)
+    return _float32_struct(len(vector)).pack(*vector)
 
 
 def _deserialize_float32(data: bytes, dims: int) -> List[float]:
     """Deserialize bytes back to a float vector."""
-    return list(struct.unpack(f"{dims}f", data))
+    return list(_float32_struct(dims).unpack(data))
+
+
+_FILTER_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _payload_filter_sql(filters: Optional[Dict[str, Any]], column: str) -> Tuple[str, List[Any]]:
+    """Translate plain string-equality filters into JSON1 predicates on *column*.
+
+    Operators, AND/OR/NOT and wildcards are left to ``matches_filters``, which
+    still runs on every returned row.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for key, condition in (filters or {}).items():
+        if isinstance(condition, str) and condition != "*" and _FILTER_KEY_RE.match(key):
+            clauses.append(f"json_extract({column}, '$.{key}') = ?")
+            params.append(condition)
+    return "".join(f" AND {c}" for c in clauses), params
 
 
 class SqliteVecStore(VectorStoreBase):
@@ -103,7 +129,12 @@ class SqliteVecStore(VectorStoreBase):
                 self._conn.execute(
                     f"CREATE INDEX IF NOT EXISTS [idx_{name}_uuid] ON [{payload_table}](uuid)"
                 )
-                self._conn.commit()
+            # Expression index for the user_id filter pushed down by list().
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS [idx_{name}_user_id] "
+                f"ON [{payload_table}](json_extract(payload, '$.user_id'))"
+            )
+            self._conn.commit()
 
     def create_col(self, name: str, vector_size: int, distance: str = "cosine") -> None:
         self._check_open()
@@ -130,34 +161,53 @@ class SqliteVecStore(VectorStoreBase):
         vec_table = self._vec_table(self.collection_name)
         payload_table = self._payload_table(self.collection_name)
 
+        # Serialize outside the lock; only SQL runs while holding it.
+        blobs = [_serialize_float32(vector) for vector in vectors]
+        payload_json = [json.dumps(payload, default=str) for payload in payloads]
+
         with self._lock:
-            for vector_id, vector, payload in zip(ids, vectors, payloads):
-                # Check if uuid already exists (upsert)
-                existing = self._conn.execute(
-                    f"SELECT rowid FROM [{payload_table}] WHERE uuid = ?",
-                    (vector_id,),
-                ).fetchone()
-
-                if existing:
-                    rowid = existing["rowid"]
-                    self._conn.execute(
-                        f"UPDATE [{payload_table}] SET payload = ? WHERE rowid = ?",
-                        (json.dumps(payload, default=str), rowid),
-                    )
-                    self._conn.execute(
-                        f"UPDATE [{vec_table}] SET embedding = ? WHERE rowid = ?",
-                        (_serialize_float32(vector), rowid),
-                    )
+            # Resolve existing rows (upserts) with one lookup per chunk of ids.
+            rowids: Dict[str, int] = {}
+            for start in range(0, len(ids), 900):
+                chunk = ids[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT uuid, rowid FROM [{payload_table}] WHERE uuid IN ({placeholders})",
+                    chunk,
+                ):
+                    rowids[row["uuid"]] = row["rowid"]
+
+            payload_updates = []
+            vec_updates = []
+            vec_inserts = []
+            for vector_id, blob, payload in zip(ids, blobs, payload_json):
+                rowid = rowids.get(vector_id)
+                if rowid is not None:
+                    payload_updates.append((payload, rowid))
+                    vec_updates.append((blob, rowid))
                 else:
                     cursor = self._conn.execute(
                         f"INSERT INTO [{payload_table}] (uuid, payload) VALUES (?, ?)",
-                        (vector_id, json.dumps(payload, default=str)),
-                    )
-                    rowid = cursor.lastrowid
-                    self._conn.execute(
-                        f"INSERT INTO [{vec_table}] (rowid, embedding) VALUES (?, ?)",
-                        (rowid, _serialize_float32(vector)),
+                        (vector_id, payload),
                     )
+                    rowids[vector_id] = cursor.lastrowid
+                    vec_inserts.append((cursor.lastrowid, blob))
+
+            if payload_updates:
+                self._conn.executemany(
+                    f"UPDATE [{payload_table}] SET payload = ? WHERE rowid = ?",
+                    payload_updates,
+                )
+            if vec_inserts:
+                self._conn.executemany(
+                    f"INSERT INTO [{vec_table}] (rowid, embedding) VALUES (?, ?)",
+                    vec_inserts,
+                )
+            if vec_updates:
+                self._conn.executemany(
+                    f"UPDATE [{vec_table}] SET embedding = ? WHERE rowid = ?",
+                    vec_updates,
+                )
             self._conn.commit()
 
     def search(
@@ -175,35 +225,29 @@ class SqliteVecStore(VectorStoreBase):
         fetch_limit = limit * 3 if filters else limit
 
         with self._lock:
-            # Check if collection has any rows first
-            count = self._conn.execute(
-                f"SELECT COUNT(*) as cnt FROM [{payload_table}]"
-            ).fetchone()
-            if not count or count["cnt"] == 0:
+            # Check if collection has any rows first; LIMIT 1 avoids a full COUNT(*)
+            if self._conn.execute(
+                f"SELECT 1 FROM [{payload_table}] LIMIT 1"
+            ).fetchone() is None:
                 return []
 
-            # sqlite-vec requires `k = ?` in WHERE clause for KNN queries
-            rows = self._conn.execute(
-                f"""SELECT v.rowid, v.distance
-                    FROM [{vec_table}] v
-                    WHERE v.embedding MATCH ? AND k = ?""",
-                (_serialize_float32(vectors), fetch_limit),
+            # sqlite-vec requires `k = ?` in WHERE clause for KNN queries; the
+            # KNN runs in a CTE so payloads are joined in the same statement.
+            filter_sql, filter_params = _payload_filter_sql(filters, "p.payload")
+            results_raw = self._conn.execute(
+                f"""WITH knn AS (
+                        SELECT rowid, distance
+                        FROM [{vec_table}]
+                        WHERE embedding MATCH ? AND k = ?
+                    )
+                    SELECT knn.distance, p.uuid, p.payload
+                    FROM knn
+                    JOIN [{payload_table}] p ON p.rowid = knn.rowid
+                    WHERE 1{filter_sql}
+                    ORDER BY knn.distance""",
+                (_serialize_float32(vectors), fetch_limit, *filter_params),
             ).fetchall()
 
-            # Join with payload table in a second step
-            results_raw = []
-            for row in rows:
-                p = self._conn.execute(
-                    f"SELECT uuid, payload FROM [{payload_table}] WHERE rowid = ?",
-                    (row["rowid"],),
-                ).fetchone()
-                if p:
-                    results_raw.append({
-                        "distance": row["distance"],
-                        "uuid": p["uuid"],
-                        "payload": p["payload"],
-                    })
-
         results = []
         for item in results_raw:
             payload = {}
@@ -343,10 +387,11 @@ class SqliteVecStore(VectorStoreBase):
         payload_table = self._payload_table(self.collection_name)
         effective_limit = limit or 100
 
+        filter_sql, filter_params = _payload_filter_sql(filters, "payload")
         with self._lock:
             rows = self._conn.execute(
-                f"SELECT uuid, payload FROM [{payload_table}] LIMIT ?",
-                (effective_limit * 3 if filters else effective_limit,),
+                f"SELECT uuid, payload FROM [{payload_table}] WHERE 1{filter_sql} LIMIT ?",
+                (*filter_params, effective_limit * 3 if filters else effective_limit),
             ).fetchall()
 
         results = []
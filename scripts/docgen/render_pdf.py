@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import html
 from pathlib import Path
 from typing import Any, Dict, List
 
 
+@functools.lru_cache(maxsize=1)
 def _load_reportlab() -> Dict[str, Any]:
     try:
         from reportlab.lib.pagesizes import LETTER
@@ -36,7 +38,7 @@ def _load_reportlab() -> Dict[str, Any]:
 def render_file_pdf(payload: Dict[str, Any], output_pdf: str | Path) -> int:
     """Render one deep file-guide PDF and return the resulting page count."""
     rl = _load_reportlab()
-    styles = _styles(rl)
+    styles = _styles()
 
     out_path = Path(output_pdf)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -88,7 +90,7 @@ def render_file_pdf(payload: Dict[str, Any], output_pdf: str | Path) -> int:
 def render_index_pdf(index_payload: Dict[str, Any], output_pdf: str | Path) -> int:
     """Render the global index PDF and return page count."""
     rl = _load_reportlab()
-    styles = _styles(rl)
+    styles = _styles()
 
     out_path = Path(output_pdf)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -138,7 +140,10 @@ def render_index_pdf(index_payload: Dict[str, Any], output_pdf: str | Path) -> i
     return page_count
 
 
-def _styles(rl: Dict[str, Any]) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=1)
+def _styles() -> Dict[str, Any]:
+    """Build the paragraph styles once; they are read-only during rendering."""
+    rl = _load_reportlab()
     style_sheet = rl["getSampleStyleSheet"]()
     paragraph_style = rl["ParagraphStyle"]
 
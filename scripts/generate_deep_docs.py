@@ -14,6 +14,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:  # Optional fast JSON parser
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 try:  # Script execution path: /.../scripts on sys.path
     from docgen.analyze import (
         analyze_non_python_file,
@@ -32,6 +37,10 @@ except ModuleNotFoundError:  # Module import path: scripts.generate_deep_docs
     from scripts.docgen.render_pdf import render_file_pdf, render_index_pdf
 
 
+# Below this many jobs, generation runs serially without a worker pool.
+_SERIAL_JOB_THRESHOLD = 4
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate deep per-file PDF documentation.")
     parser.add_argument(
@@ -82,6 +91,7 @@ def main(argv: List[str] | None = None) -> int:
     output_dir = Path(args.output_dir).resolve()
     files_dir = output_dir / "files"
     manifest_path = output_dir / "manifest.json"
+    manifest_items_path = output_dir / "manifest.jsonl"
     index_path = output_dir / "INDEX.pdf"
 
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -97,8 +107,7 @@ def main(argv: List[str] | None = None) -> int:
     for rel in selected:
         print(f"[docgen]  - {rel}")
 
-    prev_manifest = _load_manifest(manifest_path)
-    prev_index = {item["source_path"]: item for item in prev_manifest.get("items", [])}
+    prev_index = {item["source_path"]: item for item in _load_manifest_items(manifest_items_path, manifest_path)}
 
     commit_hash = _get_commit_hash(repo_root)
     run_ts = _utc_now()
@@ -108,12 +117,24 @@ def main(argv: List[str] | None = None) -> int:
 
     for rel in selected:
         src = repo_root / rel
-        sha = _sha256_file(src)
+        stat = src.stat()
         output_rel = f"files/{_sanitize_path(rel)}"
         output_abs = output_dir / output_rel
-        line_count = _line_count(src)
 
         previous = prev_index.get(rel)
+        if (
+            previous is not None
+            and previous.get("source_mtime_ns") == stat.st_mtime_ns
+            and previous.get("source_size") == stat.st_size
+            and "line_count" in previous
+        ):
+            # Fast path: same mtime and size as the last run, skip re-reading.
+            sha = previous["source_sha256"]
+            line_count = previous["line_count"]
+        else:
+            sha = _sha256_file(src)
+            line_count = _line_count(src)
+
         unchanged = (
             previous is not None
             and previous.get("source_sha256") == sha
@@ -134,6 +155,8 @@ def main(argv: List[str] | None = None) -> int:
                     "source_path": rel,
                     "source_abs": src,
                     "source_sha256": sha,
+                    "source_mtime_ns": stat.st_mtime_ns,
+                    "source_size": stat.st_size,
                     "output_pdf": output_rel,
                     "output_abs": output_abs,
                     "line_count": line_count,
@@ -143,14 +166,24 @@ def main(argv: List[str] | None = None) -> int:
         else:
             reused = dict(previous)
             reused["line_count"] = line_count
+            reused["source_mtime_ns"] = stat.st_mtime_ns
+            reused["source_size"] = stat.st_size
             skipped_entries[rel] = reused
 
     print(f"[docgen] generate={len(jobs)} skip={len(skipped_entries)}")
 
     generated_entries: Dict[str, Dict[str, Any]] = {}
 
-    if jobs:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max(args.max_workers, 1)) as executor:
+    # Small batches render faster inline than through a worker pool.
+    effective_workers = 1 if len(jobs) < _SERIAL_JOB_THRESHOLD else max(args.max_workers, 1)
+
+    if jobs and effective_workers == 1:
+        for job in jobs:
+            result = _generate_one(repo_root, commit_hash, job)
+            generated_entries[job["source_path"]] = result
+            _print_rendered(job["source_path"], result)
+    elif jobs:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=effective_workers) as executor:
             future_map = {
                 executor.submit(_generate_one, repo_root, commit_hash, job): job["source_path"]
                 for job in jobs
@@ -159,10 +192,7 @@ def main(argv: List[str] | None = None) -> int:
                 source_path = future_map[future]
                 result = future.result()
                 generated_entries[source_path] = result
-                print(
-                    f"[docgen] rendered {source_path} -> {result['output_pdf']} "
-                    f"({result['page_count']} pages)"
-                )
+                _print_rendered(source_path, result)
 
     all_entries: List[Dict[str, Any]] = []
     for rel in selected:
@@ -193,6 +223,7 @@ def main(argv: List[str] | None = None) -> int:
     index_pages = render_index_pdf(index_payload, index_path)
 
     manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=False), encoding="utf-8")
+    _write_manifest_items(manifest_items_path, all_entries)
 
     print(f"[docgen] wrote manifest: {manifest_path}")
     print(f"[docgen] wrote index: {index_path} ({index_pages} pages)")
@@ -229,6 +260,8 @@ def _generate_one(repo_root: Path, commit_hash: str, job: Dict[str, Any]) -> Dic
     return {
         "source_path": source_path,
         "source_sha256": job["source_sha256"],
+        "source_mtime_ns": job["source_mtime_ns"],
+        "source_size": job["source_size"],
         "output_pdf": job["output_pdf"],
         "line_count": analysis.get("line_count", job["line_count"]),
         "page_count": page_count,
@@ -238,6 +271,13 @@ def _generate_one(repo_root: Path, commit_hash: str, job: Dict[str, Any]) -> Dic
     }
 
 
+def _print_rendered(source_path: str, result: Dict[str, Any]) -> None:
+    print(
+        f"[docgen] rendered {source_path} -> {result['output_pdf']} "
+        f"({result['page_count']} pages)"
+    )
+
+
 def _group_for_index(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
@@ -287,14 +327,44 @@ def _load_manifest(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
     except Exception:
         return {}
 
 
+def _load_manifest_items(items_path: Path, manifest_path: Path) -> List[Dict[str, Any]]:
+    """Load previous manifest items, streaming ``manifest.jsonl`` when present."""
+    if not items_path.exists():
+        return _load_manifest(manifest_path).get("items", [])
+    items: List[Dict[str, Any]] = []
+    try:
+        with items_path.open("rb") as handle:
+            for line in handle:
+                if line.strip():
+                    items.append(orjson.loads(line) if orjson is not None else json.loads(line))
+    except Exception:
+        return _load_manifest(manifest_path).get("items", [])
+    return items
+
+
+def _write_manifest_items(path: Path, items: List[Dict[str, Any]]) -> None:
+    """Write one manifest item per line so incremental runs can stream them."""
+    with path.open("wb") as handle:
+        for item in items:
+            if orjson is not None:
+                handle.write(orjson.dumps(item) + b"\n")
+            else:
+                handle.write(json.dumps(item, separators=(",", ":")).encode("utf-8") + b"\n")
+
+
 def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
         while True:
             chunk = handle.read(65536)
             if not chunk:
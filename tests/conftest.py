@@ -0,0 +1,98 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from engram.db.sqlite import SQLiteManager
+
+
+def pytest_configure(config):
+    # Databases opened indirectly (e.g. through Memory) use the fast pragmas too.
+    os.environ.setdefault("ENGRAM_SQLITE_FAST", "1")
+    config.addinivalue_line("markers", "parallel: exercises ParallelExecutor thread pools")
+    config.addinivalue_line("markers", "sqlite: backed by a real SQLite database")
+
+
+@pytest.fixture(scope="session")
+def fast_tmp_root(tmp_path_factory):
+    """Directory for throwaway database files, on tmpfs (/dev/shm) when available."""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix="engram-tests-", dir=shm))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.getbasetemp()
+
+
+@pytest.fixture(scope="session")
+def sqlite_template_path(fast_tmp_root):
+    """Path to a database with the full schema applied, built once per session.
+
+    Fixtures copy this file instead of re-running schema creation and
+    migrations for every test.
+    """
+    path = fast_tmp_root / "template.db"
+    SQLiteManager(str(path)).close()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def memories_columns(sqlite_template_path):
+    """Column names of the migrated ``memories`` table, read once per session."""
+    conn = sqlite3.connect(sqlite_template_path)
+    try:
+        return {row[1] for row in conn.execute("PRAGMA table_info(memories)")}
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def _memory_template():
+    """In-memory database with the full schema, built once per session."""
+    template = SQLiteManager(":memory:")
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def memory_db(_memory_template):
+    """Fresh in-memory SQLiteManager copied from the schema template."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    _memory_template._conn.backup(conn)
+    mgr = SQLiteManager.from_connection(conn)
+    yield mgr
+    mgr.close()
+
+
+# Every table Memory.add() can write to; cleared between tests sharing a Memory.
+_MEMORY_RESET_SCRIPT = """
+BEGIN IMMEDIATE;
+DELETE FROM memory_history;
+DELETE FROM decay_log;
+DELETE FROM scene_memories;
+DELETE FROM scenes;
+DELETE FROM profile_memories;
+DELETE FROM profiles;
+DELETE FROM categories;
+DELETE FROM memories;
+COMMIT;
+"""
+
+
+@pytest.fixture(scope="session")
+def reset_memory():
+    """Callable that empties a module-scoped Memory between tests.
+
+    Cheaper than building a new Memory (schema, migrations, providers) per test.
+    """
+    def _reset(mem):
+        with mem.db._get_connection() as conn:
+            conn.executescript(_MEMORY_RESET_SCRIPT)
+        mem.vector_store.reset()
+    return _reset
@@ -1,21 +1,14 @@
 """Tests for backward compatibility — existing Memory operations still work."""
 
-import os
-import tempfile
 import uuid
 
 import pytest
 
-from engram.db.sqlite import SQLiteManager
-
 
 @pytest.fixture
-def db():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    mgr = SQLiteManager(path)
-    yield mgr
-    os.unlink(path)
+def db(memory_db):
+    """In-memory database copied from the session schema template."""
+    return memory_db
 
 
 class TestMemoryBackwardCompat:
@@ -61,6 +54,15 @@ class TestMemoryBackwardCompat:
         all_mems = db.get_all_memories()
         assert len(all_mems) == 3
 
+    def test_count_memories(self, db):
+        db.add_memory({"memory": "mem1", "user_id": "u1"})
+        db.add_memory({"memory": "mem2", "user_id": "u1", "layer": "lml"})
+        db.add_memory({"memory": "mem3", "user_id": "u2"})
+
+        assert db.count_memories() == 3
+        assert db.count_memories(user_id="u1") == 2
+        assert db.count_memories(user_id="u1", layer="lml") == 1
+
     def test_increment_access(self, db):
         mem_id = db.add_memory({"memory": "test", "user_id": "default"})
         db.increment_access(mem_id)
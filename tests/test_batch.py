@@ -4,21 +4,19 @@ Tests correctness of batch add, batch echo, batch embed, batch category,
 and batch DB insert. Verifies fallback behavior on failure.
 """
 
-import os
-import tempfile
 import pytest
 
 from engram.configs.base import BatchConfig, MemoryConfig
 from engram.memory.main import Memory
 
 
-def _make_memory(tmpdir, batch_enabled=True, echo_enabled=True, categories_enabled=True):
+def _make_memory(batch_enabled=True, echo_enabled=True, categories_enabled=True):
     """Create a Memory instance configured for testing with batch support."""
     config = MemoryConfig(
         vector_store={"provider": "memory", "config": {}},
         llm={"provider": "mock", "config": {}},
         embedder={"provider": "simple", "config": {}},
-        history_db_path=os.path.join(tmpdir, "test.db"),
+        history_db_path=":memory:",
         graph={"enable_graph": False},
         scene={"enable_scenes": False},
         profile={"enable_profiles": False},
@@ -53,105 +51,97 @@ class TestBatchConfig:
 
 class TestAddBatch:
     def test_basic_batch_add(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir)
-            items = [
-                {"content": "User likes Python"},
-                {"content": "User works at Acme Corp"},
-                {"content": "User prefers dark mode"},
-            ]
-            result = m.add_batch(items, user_id="test_user")
-            assert "results" in result
-            assert len(result["results"]) == 3
-            for r in result["results"]:
-                assert r["event"] == "ADD"
-                assert r["id"]
-                assert r["memory"]
-            m.close()
+        m = _make_memory()
+        items = [
+            {"content": "User likes Python"},
+            {"content": "User works at Acme Corp"},
+            {"content": "User prefers dark mode"},
+        ]
+        result = m.add_batch(items, user_id="test_user")
+        assert "results" in result
+        assert len(result["results"]) == 3
+        for r in result["results"]:
+            assert r["event"] == "ADD"
+            assert r["id"]
+            assert r["memory"]
+        m.close()
 
     def test_batch_with_disabled_config_falls_back(self):
         """When batch is disabled, add_batch falls back to sequential add()."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, batch_enabled=False)
-            items = [
-                {"content": "Fact one"},
-                {"content": "Fact two"},
-            ]
-            result = m.add_batch(items, user_id="test_user")
-            assert "results" in result
-            assert len(result["results"]) == 2
-            m.close()
+        m = _make_memory(batch_enabled=False)
+        items = [
+            {"content": "Fact one"},
+            {"content": "Fact two"},
+        ]
+        result = m.add_batch(items, user_id="test_user")
+        assert "results" in result
+        assert len(result["results"]) == 2
+        m.close()
 
     def test_empty_items(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir)
-            result = m.add_batch([], user_id="test_user")
-            assert result == {"results": []}
-            m.close()
+        m = _make_memory()
+        result = m.add_batch([], user_id="test_user")
+        assert result == {"results": []}
+        m.close()
 
     def test_batch_produces_searchable_memories(self):
         """Memories added via batch should be searchable."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, echo_enabled=False, categories_enabled=False)
-            items = [
-                {"content": "User loves hiking in mountains"},
-                {"content": "User is allergic to peanuts"},
-            ]
-            m.add_batch(items, user_id="test_user")
-
-            # Search should find the memories
-            search_result = m.search("hiking", user_id="test_user")
-            assert len(search_result["results"]) > 0
-            m.close()
+        m = _make_memory(echo_enabled=False, categories_enabled=False)
+        items = [
+            {"content": "User loves hiking in mountains"},
+            {"content": "User is allergic to peanuts"},
+        ]
+        m.add_batch(items, user_id="test_user")
+
+        # Search should find the memories
+        search_result = m.search("hiking", user_id="test_user")
+        assert len(search_result["results"]) > 0
+        m.close()
 
     def test_batch_respects_max_batch_size(self):
         """Items exceeding max_batch_size are split into chunks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, echo_enabled=False, categories_enabled=False)
-            # max_batch_size is 10, so 15 items should be split into 2 chunks
-            items = [{"content": f"Fact number {i}"} for i in range(15)]
-            result = m.add_batch(items, user_id="test_user")
-            assert len(result["results"]) == 15
-            m.close()
+        m = _make_memory(echo_enabled=False, categories_enabled=False)
+        # max_batch_size is 10, so 15 items should be split into 2 chunks
+        items = [{"content": f"Fact number {i}"} for i in range(15)]
+        result = m.add_batch(items, user_id="test_user")
+        assert len(result["results"]) == 15
+        m.close()
 
     def test_batch_with_per_item_metadata(self):
         """Each item can have its own metadata."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, echo_enabled=False, categories_enabled=False)
-            items = [
-                {"content": "Item A", "metadata": {"source": "email"}},
-                {"content": "Item B", "metadata": {"source": "chat"}},
-            ]
-            result = m.add_batch(items, user_id="test_user")
-            assert len(result["results"]) == 2
-            m.close()
+        m = _make_memory(echo_enabled=False, categories_enabled=False)
+        items = [
+            {"content": "Item A", "metadata": {"source": "email"}},
+            {"content": "Item B", "metadata": {"source": "chat"}},
+        ]
+        result = m.add_batch(items, user_id="test_user")
+        assert len(result["results"]) == 2
+        m.close()
 
     def test_batch_with_categories(self):
         """Items can have per-item categories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, echo_enabled=False)
-            items = [
-                {"content": "I prefer Python", "categories": ["preferences"]},
-                {"content": "Meeting at 3pm", "categories": ["context"]},
-            ]
-            result = m.add_batch(items, user_id="test_user")
-            assert len(result["results"]) == 2
-            assert result["results"][0]["categories"] == ["preferences"]
-            assert result["results"][1]["categories"] == ["context"]
-            m.close()
+        m = _make_memory(echo_enabled=False)
+        items = [
+            {"content": "I prefer Python", "categories": ["preferences"]},
+            {"content": "Meeting at 3pm", "categories": ["context"]},
+        ]
+        result = m.add_batch(items, user_id="test_user")
+        assert len(result["results"]) == 2
+        assert result["results"][0]["categories"] == ["preferences"]
+        assert result["results"][1]["categories"] == ["context"]
+        m.close()
 
 
 class TestBatchDBInsert:
     def test_batch_insert_creates_records(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            m = _make_memory(tmpdir, echo_enabled=False, categories_enabled=False)
-            items = [{"content": f"Memory {i}"} for i in range(5)]
-            m.add_batch(items, user_id="test_user")
-
-            # Verify all 5 are in DB
-            all_mems = m.get_all(user_id="test_user", limit=100)
-            assert len(all_mems["results"]) == 5
-            m.close()
+        m = _make_memory(echo_enabled=False, categories_enabled=False)
+        items = [{"content": f"Memory {i}"} for i in range(5)]
+        m.add_batch(items, user_id="test_user")
+
+        # Verify all 5 are in DB
+        all_mems = m.get_all(user_id="test_user", limit=100)
+        assert len(all_mems["results"]) == 5
+        m.close()
 
 
 class TestEmbedBatch:
@@ -52,3 +52,11 @@ def test_known_similarity():
     norm_b = math.sqrt(16 + 25 + 36)  # sqrt(77)
     expected = dot / (norm_a * norm_b)
     assert cosine_similarity(a, b) == pytest.approx(expected, abs=1e-6)
+
+
+def test_batch_matches_pairwise():
+    from engram.utils.math import cosine_similarity_batch
+    query = [1.0, 2.0, 3.0]
+    store = [[4.0, 5.0, 6.0], [0.0, 0.0, 0.0], [-1.0, -2.0, -3.0]]
+    expected = [cosine_similarity(query, v) for v in store]
+    assert cosine_similarity_batch(query, store) == pytest.approx(expected, abs=1e-6)
@@ -1,8 +1,6 @@
 """Tests for engram.core.distillation — Replay-driven semantic distillation."""
 
 import json
-import os
-import tempfile
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
@@ -10,17 +8,12 @@ import pytest
 
 from engram.configs.base import DistillationConfig
 from engram.core.distillation import ReplayDistiller
-from engram.db.sqlite import SQLiteManager
 
 
 @pytest.fixture
-def tmp_db():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    db = SQLiteManager(path)
-    yield db
-    db.close()
-    os.unlink(path)
+def tmp_db(memory_db):
+    """In-memory database copied from the session schema template."""
+    return memory_db
 
 
 @pytest.fixture
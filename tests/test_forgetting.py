@@ -1,7 +1,5 @@
 """Tests for engram.core.forgetting — Advanced forgetting mechanisms."""
 
-import os
-import tempfile
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
@@ -12,17 +10,11 @@ from engram.core.forgetting import (
     InterferencePruner,
     RedundancyCollapser,
 )
-from engram.db.sqlite import SQLiteManager
 
 
 @pytest.fixture
-def tmp_db():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    db = SQLiteManager(path)
-    yield db
-    db.close()
-    os.unlink(path)
+def tmp_db(memory_db):
+    return memory_db
 
 
 @pytest.fixture
@@ -2,7 +2,13 @@
 
 import pytest
 
-from engram.core.intent import QueryIntent, classify_intent
+from engram.core.intent import (
+    _ANY_SIGNAL,
+    _EPISODIC_PATTERNS,
+    _SEMANTIC_PATTERNS,
+    QueryIntent,
+    classify_intent,
+)
 
 
 class TestEpisodicQueries:
@@ -88,3 +94,16 @@ class TestEdgeCases:
         long_query = "when did " * 100
         result = classify_intent(long_query)
         assert result == QueryIntent.EPISODIC
+
+    def test_prefilter_agrees_with_patterns(self):
+        queries = [
+            "When did we discuss the API?",
+            "What's my favorite color?",
+            "project update",
+            "Python",
+            "I asked 2 weeks ago",
+        ]
+        all_patterns = _EPISODIC_PATTERNS + _SEMANTIC_PATTERNS
+        for query in queries:
+            expected = any(pattern.search(query) for pattern, _ in all_patterns)
+            assert bool(_ANY_SIGNAL.search(query)) == expected
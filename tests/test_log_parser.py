@@ -2,7 +2,6 @@
 
 import json
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -21,9 +20,8 @@ from engram.core.log_parser import (
 # ---------------------------------------------------------------------------
 
 def _write_jsonl(path: str, entries: list) -> None:
-    with open(path, "w", encoding="utf-8") as fh:
-        for entry in entries:
-            fh.write(json.dumps(entry) + "\n")
+    data = "".join(json.dumps(entry) + "\n" for entry in entries)
+    Path(path).write_bytes(data.encode("utf-8"))
 
 
 SAMPLE_CONVERSATION = [
@@ -315,11 +313,12 @@ class TestFindLatestLog:
 
         old = proj_dir / "old-session.jsonl"
         old.write_text("{}\n", encoding="utf-8")
-        # Force older mtime
-        os.utime(str(old), (1000000, 1000000))
-
         new = proj_dir / "new-session.jsonl"
         new.write_text("{}\n", encoding="utf-8")
+        # Explicit ordering, independent of wall-clock resolution
+        base_ns = 1_700_000_000 * 10**9
+        os.utime(str(old), ns=(base_ns, base_ns))
+        os.utime(str(new), ns=(base_ns + 10**9, base_ns + 10**9))
 
         monkeypatch.setattr(Path, "home", lambda: tmp_path)
 
@@ -0,0 +1,167 @@
+"""Tests for the LongMemEval benchmark runner and retrieval metrics."""
+
+import argparse
+import json
+import os
+from contextlib import contextmanager
+
+import pytest
+
+from engram.benchmarks.longmemeval import (
+    _load_dataset,
+    build_memory,
+    compute_session_metrics,
+    extract_user_only_text,
+    run_longmemeval,
+)
+
+
+def test_extract_user_only_text_filters_non_user_roles():
+    turns = [
+        {"role": "user", "content": "  first  "},
+        {"role": "assistant", "content": "ignored"},
+        {"role": "user", "content": "   "},
+        {"role": "user", "content": "second"},
+    ]
+    assert extract_user_only_text(turns) == "first\nsecond"
+
+
+def test_session_metrics_cutoffs():
+    metrics = compute_session_metrics(["s9", "s1", "s1", "s8", "s2"], ["s1", "s2"])
+    assert metrics["recall_any@1"] == 0.0
+    assert metrics["recall_any@3"] == 1.0
+    assert metrics["recall_all@3"] == 0.0
+    # Duplicates are dropped before ranking, so s2 is rank 4.
+    assert metrics["recall_all@5"] == 1.0
+    assert metrics["recall_all@10"] == 1.0
+
+
+def test_session_metrics_without_gold_or_results():
+    assert set(compute_session_metrics(["s1"], []).values()) == {0.0}
+    assert set(compute_session_metrics([], ["s1"]).values()) == {0.0}
+
+
+def test_load_dataset_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"question_id": "q1"}]))
+    mtime = os.stat(path).st_mtime_ns
+    first = _load_dataset(str(path), mtime)
+    assert _load_dataset(str(path), mtime) is first
+
+    path.write_text(json.dumps([{"question_id": "q2"}]))
+    os.utime(path, ns=(mtime + 1_000_000, mtime + 1_000_000))
+    reloaded = _load_dataset(str(path), os.stat(path).st_mtime_ns)
+    assert reloaded == ({"question_id": "q2"},)
+
+
+def test_load_dataset_rejects_non_list(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"question_id": "q1"}))
+    with pytest.raises(ValueError, match="JSON list"):
+        _load_dataset(str(path), os.stat(path).st_mtime_ns)
+
+
+class _StubLLM:
+    def generate(self, prompt):
+        return "stub answer"
+
+
+class _StubDB:
+    def __init__(self):
+        self.transactions = 0
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        yield self
+
+
+class _StubMemory:
+    def __init__(self):
+        self.llm = _StubLLM()
+        self.db = _StubDB()
+        self.batches = []
+
+    def delete_all(self, user_id):
+        pass
+
+    def add_batch(self, items, user_id):
+        self.batches.append(items)
+        return {"results": [{"id": str(i)} for i in range(len(items))]}
+
+    def search_with_context(self, query, user_id, limit):
+        return {"results": [
+            {"memory": item["content"], "metadata": item["metadata"]}
+            for item in self.batches[-1]
+        ]}
+
+
+def test_run_longmemeval_adds_each_question_in_one_batch(tmp_path, monkeypatch):
+    stub = _StubMemory()
+    monkeypatch.setattr("engram.benchmarks.longmemeval.build_memory", lambda **kwargs: stub)
+    dataset = [{
+        "question_id": "q1",
+        "question": "Where did I go hiking?",
+        "answer_session_ids": ["s2"],
+        "haystack_session_ids": ["s1", "s2"],
+        "haystack_dates": ["2024-01-01", "2024-01-02"],
+        "haystack_sessions": [
+            [{"role": "user", "content": "I baked bread today."}],
+            [{"role": "user", "content": "I went hiking in the Alps."}],
+        ],
+    }]
+    dataset_path = tmp_path / "data.json"
+    dataset_path.write_text(json.dumps(dataset))
+    args = argparse.Namespace(
+        dataset_path=str(dataset_path),
+        output_jsonl=str(tmp_path / "out.jsonl"),
+        retrieval_jsonl=None,
+        include_debug_fields=True,
+        user_id="lme",
+        start_index=0,
+        end_index=-1,
+        max_questions=-1,
+        skip_abstention=False,
+        top_k=2,
+        max_context_chars=2000,
+        print_every=0,
+        answer_backend="engram-llm",
+        hf_model=None,
+        hf_max_new_tokens=16,
+        llm_provider="mock",
+        llm_model=None,
+        embedder_provider="simple",
+        embedder_model=None,
+        embedding_dims=64,
+        vector_store_provider="memory",
+        history_db_path=":memory:",
+        full_potential=False,
+    )
+    summary = run_longmemeval(args)
+    assert summary["processed"] == 1
+    assert len(stub.batches) == 1
+    assert stub.db.transactions == 1
+    assert [item["metadata"]["session_id"] for item in stub.batches[0]] == ["s1", "s2"]
+    row = json.loads((tmp_path / "out.jsonl").read_text())
+    assert row == {
+        "question_id": "q1",
+        "hypothesis": "stub answer",
+        "retrieved_session_ids": ["s1", "s2"],
+        "retrieval_metrics": compute_session_metrics(["s1", "s2"], ["s2"]),
+    }
+    assert row["retrieval_metrics"]["recall_all@3"] == 1.0
+
+
+def test_build_memory_minimal_keeps_per_item_ingestion():
+    memory = build_memory(
+        llm_provider="mock",
+        embedder_provider="simple",
+        vector_store_provider="memory",
+        embedding_dims=64,
+        history_db_path=":memory:",
+        full_potential=False,
+    )
+    try:
+        assert memory.config.batch.enable_batch is False
+    finally:
+        memory.close()
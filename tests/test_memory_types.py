@@ -1,7 +1,7 @@
 """Tests for CLS memory type classification and backward compatibility."""
 
-import os
-import tempfile
+import shutil
+import uuid
 
 import pytest
 
@@ -12,40 +12,49 @@ from engram.db.sqlite import SQLiteManager
 
 
 @pytest.fixture
-def tmp_db():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    db = SQLiteManager(path)
+def tmp_db(sqlite_template_path, fast_tmp_root):
+    path = fast_tmp_root / f"{uuid.uuid4().hex}.db"
+    shutil.copyfile(sqlite_template_path, path)
+    db = SQLiteManager(str(path), fast=True)
     yield db
     db.close()
-    os.unlink(path)
+    path.unlink(missing_ok=True)
 
 
-class TestDistillationConfig:
-    def test_defaults_all_enabled(self):
-        config = DistillationConfig()
-        assert config.enable_memory_types is True
-        assert config.enable_distillation is True
-        assert config.enable_interference_pruning is True
-        assert config.enable_redundancy_collapse is True
-        assert config.enable_homeostasis is True
-        assert config.enable_multi_trace is True
-        assert config.enable_intent_routing is True
+@pytest.fixture(scope="module")
+def memory_config():
+    return MemoryConfig()
 
-    def test_memory_config_has_distillation(self):
-        mc = MemoryConfig()
-        assert hasattr(mc, "distillation")
-        assert isinstance(mc.distillation, DistillationConfig)
 
-    def test_version_updated(self):
-        mc = MemoryConfig()
-        assert mc.version == "v1.4"
+@pytest.fixture(scope="class")
+def distillation_config():
+    return DistillationConfig()
 
-    def test_default_config_has_cls_enabled(self):
+
+class TestDistillationConfig:
+    @pytest.mark.parametrize("flag", [
+        "enable_memory_types",
+        "enable_distillation",
+        "enable_interference_pruning",
+        "enable_redundancy_collapse",
+        "enable_homeostasis",
+        "enable_multi_trace",
+        "enable_intent_routing",
+    ])
+    def test_defaults_all_enabled(self, distillation_config, flag):
+        assert getattr(distillation_config, flag) is True
+
+    def test_memory_config_has_distillation(self, memory_config):
+        assert hasattr(memory_config, "distillation")
+        assert isinstance(memory_config.distillation, DistillationConfig)
+
+    def test_version_updated(self, memory_config):
+        assert memory_config.version == "v1.4"
+
+    def test_default_config_has_cls_enabled(self, memory_config):
         """Verify a default MemoryConfig has CLS features enabled."""
-        mc = MemoryConfig()
-        assert mc.distillation.enable_memory_types is True
-        assert mc.distillation.default_memory_type == "semantic"
+        assert memory_config.distillation.enable_memory_types is True
+        assert memory_config.distillation.default_memory_type == "semantic"
 
     def test_custom_config(self):
         config = DistillationConfig(
@@ -57,19 +66,18 @@ class TestDistillationConfig:
         assert config.enable_multi_trace is True
         assert config.enable_intent_routing is True
 
+    def test_custom_config_overrides_defaults(self):
+        config = DistillationConfig(enable_memory_types=False, enable_multi_trace=False)
+        assert config.enable_memory_types is False
+        assert config.enable_multi_trace is False
+        assert config.enable_intent_routing is True
+
 
+@pytest.mark.sqlite
 class TestDBMemoryTypeColumn:
-    def test_memory_type_column_exists(self, tmp_db):
+    def test_memory_type_column_exists(self, memories_columns):
         """Verify memory_type column was added by migration."""
-        with tmp_db._get_connection() as conn:
-            row = conn.execute(
-                "PRAGMA table_info(memories)"
-            ).fetchall()
-        columns = {r["name"] for r in row}
-        assert "memory_type" in columns
-        assert "s_fast" in columns
-        assert "s_mid" in columns
-        assert "s_slow" in columns
+        assert {"memory_type", "s_fast", "s_mid", "s_slow"} <= memories_columns
 
     def test_add_memory_with_type(self, tmp_db):
         mid = tmp_db.add_memory({
@@ -118,6 +126,7 @@ class TestDBMemoryTypeColumn:
         assert mem["strength"] == pytest.approx(0.35)
 
 
+@pytest.mark.sqlite
 class TestDBEpisodicMemories:
     def test_get_episodic_memories(self, tmp_db):
         tmp_db.add_memory({
@@ -139,6 +148,7 @@ class TestDBEpisodicMemories:
         assert eps == []
 
 
+@pytest.mark.sqlite
 class TestDBDistillationTables:
     def test_distillation_log(self, tmp_db):
         run_id = tmp_db.log_distillation_run(
@@ -162,17 +172,10 @@ class TestDBDistillationTables:
         assert len(rows) == 2
 
     def test_memory_count_by_namespace(self, tmp_db):
-        for i in range(3):
-            tmp_db.add_memory({
-                "memory": f"Mem {i}",
-                "user_id": "user1",
-                "namespace": "default",
-            })
-        tmp_db.add_memory({
-            "memory": "Work mem",
-            "user_id": "user1",
-            "namespace": "work",
-        })
+        tmp_db.add_memories_batch(
+            [{"memory": f"Mem {i}", "user_id": "user1", "namespace": "default"} for i in range(3)]
+            + [{"memory": "Work mem", "user_id": "user1", "namespace": "work"}]
+        )
         counts = tmp_db.get_memory_count_by_namespace("user1")
         assert counts.get("default", 0) == 3
         assert counts.get("work", 0) == 1
@@ -0,0 +1,24 @@
+"""Tests for the in-process InMemoryVectorStore ranking."""
+
+from engram.vector_stores.memory import InMemoryVectorStore
+
+
+def _store():
+    store = InMemoryVectorStore({"embedding_model_dims": 2})
+    store.insert(
+        vectors=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7], [1.0, 0.1], [1.0, 0.0]],
+        payloads=[{"user_id": "a"}, {"user_id": "a"}, {"user_id": "b"}, {"user_id": "a"}, {"user_id": "a"}],
+        ids=["exact", "orthogonal", "diagonal", "near", "exact-dup"],
+    )
+    return store
+
+
+def test_search_returns_top_k_by_score():
+    results = _store().search(None, [1.0, 0.0], limit=3)
+    assert [r.id for r in results] == ["exact", "exact-dup", "near"]
+    assert results[0].score >= results[1].score >= results[2].score
+
+
+def test_search_applies_filters_before_ranking():
+    results = _store().search(None, [1.0, 0.0], limit=10, filters={"user_id": "b"})
+    assert [r.id for r in results] == ["diagonal"]
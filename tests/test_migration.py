@@ -1,36 +1,42 @@
 """Tests for schema migration idempotency."""
 
-import os
 import sqlite3
-import tempfile
+import uuid
 
 import pytest
 
 from engram.db.sqlite import SQLiteManager
 
+pytestmark = pytest.mark.sqlite
+
+
+@pytest.fixture
+def db_path(fast_tmp_root):
+    path = fast_tmp_root / f"{uuid.uuid4().hex}.db"
+    yield str(path)
+    path.unlink(missing_ok=True)
+
 
 @pytest.fixture
-def db_path():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    os.unlink(path)
+def memory_uri():
+    """Shared-cache in-memory database, visible to a second connection."""
+    return f"file:engram-{uuid.uuid4().hex}?mode=memory&cache=shared"
 
 
 class TestMigrationIdempotency:
     def test_double_init(self, db_path):
         """Tables should be created with IF NOT EXISTS — double init is safe."""
-        mgr1 = SQLiteManager(db_path)
-        mgr2 = SQLiteManager(db_path)  # Should not raise
+        mgr1 = SQLiteManager(db_path, fast=True)
+        mgr2 = SQLiteManager(db_path, fast=True)  # Should not raise
 
         # Both should work
         scenes = mgr2.get_scenes(user_id="test")
         assert scenes == []
 
-    def test_tables_exist(self, db_path):
+    def test_tables_exist(self, memory_uri):
         """All expected tables should be created."""
-        mgr = SQLiteManager(db_path)
-        conn = sqlite3.connect(db_path)
+        mgr = SQLiteManager(memory_uri, fast=True)
+        conn = sqlite3.connect(memory_uri, uri=True)
         cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = {row[0] for row in cursor.fetchall()}
         conn.close()
@@ -47,10 +53,10 @@ class TestMigrationIdempotency:
         }
         assert expected.issubset(tables), f"Missing tables: {expected - tables}"
 
-    def test_scene_id_column_migration(self, db_path):
+    def test_scene_id_column_migration(self, memory_uri):
         """scene_id column should be added to memories table."""
-        mgr = SQLiteManager(db_path)
-        conn = sqlite3.connect(db_path)
+        mgr = SQLiteManager(memory_uri, fast=True)
+        conn = sqlite3.connect(memory_uri, uri=True)
         cursor = conn.execute("PRAGMA table_info(memories)")
         columns = {row[1] for row in cursor.fetchall()}
         conn.close()
@@ -92,15 +98,41 @@ class TestMigrationIdempotency:
         conn.close()
 
         # Now init with SQLiteManager (should add new tables without touching existing data)
-        mgr = SQLiteManager(db_path)
+        mgr = SQLiteManager(db_path, fast=True)
         mem = mgr.get_memory("test1")
         assert mem is not None
         assert mem["memory"] == "hello world"
 
-    def test_distillation_tables_exist(self, db_path):
-        """Distillation tables should be created."""
-        SQLiteManager(db_path)
+    def test_malformed_metadata_does_not_block_task_indexes(self, db_path):
+        """Task indexes build over, and still accept, rows with invalid JSON metadata."""
+        SQLiteManager(db_path, fast=True).close()
+        # Roll back to before the task-index migrations, with a malformed task row.
         conn = sqlite3.connect(db_path)
+        for index in ("idx_memories_task_project", "idx_memories_task_status", "idx_memories_task_parent"):
+            conn.execute(f"DROP INDEX {index}")
+        conn.execute("DELETE FROM schema_migrations WHERE version LIKE 'v2_task_%'")
+        conn.execute(
+            "INSERT INTO memories (id, memory, user_id, memory_type, metadata) "
+            "VALUES ('bad1', 'hello', 'u1', 'task', '{oops')"
+        )
+        conn.commit()
+        conn.close()
+
+        mgr = SQLiteManager(db_path, fast=True)
+        with mgr._get_connection() as conn:
+            assert mgr._is_migration_applied(conn, "v2_task_status_partial_index")
+            conn.execute(
+                "INSERT INTO memories (id, memory, user_id, memory_type, metadata) "
+                "VALUES ('bad2', 'again', 'u1', 'task', '{oops')"
+            )
+        assert mgr.get_all_memories(memory_type="task", metadata_filters={"task_status": "inbox"}) == []
+        assert mgr.count_memories(memory_type="task") == 2
+        mgr.close()
+
+    def test_distillation_tables_exist(self, memory_uri):
+        """Distillation tables should be created."""
+        mgr = SQLiteManager(memory_uri, fast=True)  # keeps the in-memory database alive
+        conn = sqlite3.connect(memory_uri, uri=True)
         cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = {row[0] for row in cursor.fetchall()}
         conn.close()
@@ -4,7 +4,6 @@ Tests correctness, thread safety, error propagation, and fallback behavior
 of the ParallelExecutor and its integration with Memory.
 """
 
-import time
 import threading
 import pytest
 
@@ -13,6 +12,7 @@ from engram.memory.parallel import ParallelExecutor
 
 # ── ParallelExecutor unit tests ─────────────────────────────────────────
 
+@pytest.mark.parallel
 class TestParallelExecutor:
     def test_empty_tasks(self):
         executor = ParallelExecutor(max_workers=2)
@@ -30,23 +30,31 @@ class TestParallelExecutor:
 
     def test_multiple_tasks_parallel(self):
         executor = ParallelExecutor(max_workers=4)
+        barrier = threading.Barrier(4, timeout=2.0)
 
-        def slow_add(a, b):
-            time.sleep(0.05)
+        def add(a, b):
+            barrier.wait()
             return a + b
 
-        tasks = [(slow_add, (i, i * 10)) for i in range(4)]
+        tasks = [(add, (i, i * 10)) for i in range(4)]
         results = executor.run_parallel(tasks)
         assert results == [0, 11, 22, 33]
         executor.shutdown()
 
     def test_results_in_order(self):
         """Results must be returned in the same order as tasks."""
-        executor = ParallelExecutor(max_workers=4)
+        # One worker per task: each task blocks until its successor finishes,
+        # forcing completion in reverse submission order.
+        executor = ParallelExecutor(max_workers=5)
+        events = [threading.Event() for _ in range(6)]
+        events[5].set()
 
         def identity(x):
-            time.sleep(0.01 * (5 - x))  # Reverse timing
-            return x
+            try:
+                assert events[x + 1].wait(timeout=2.0)
+                return x
+            finally:
+                events[x].set()
 
         tasks = [(identity, (i,)) for i in range(5)]
         results = executor.run_parallel(tasks)
@@ -76,11 +84,12 @@ class TestParallelExecutor:
         executor = ParallelExecutor(max_workers=4)
         shared_list = list(range(100))
 
-        def read_item(idx):
-            return shared_list[idx]
+        def read_batch(lo, hi):
+            return shared_list[lo:hi]
 
-        tasks = [(read_item, (i,)) for i in range(100)]
-        results = executor.run_parallel(tasks)
+        chunks = [(0, 25), (25, 50), (50, 75), (75, 100)]
+        batches = executor.run_parallel([(read_batch, chunk) for chunk in chunks])
+        results = [item for batch in batches for item in batch]
         assert results == list(range(100))
         executor.shutdown()
 
@@ -88,18 +97,19 @@ class TestParallelExecutor:
         """Verify that tasks run concurrently, not sequentially."""
         executor = ParallelExecutor(max_workers=4)
 
-        def sleep_return(x):
-            time.sleep(0.1)
+        # A serial pool can never release the barrier: the first task would
+        # block until the timeout and raise BrokenBarrierError.
+        barrier = threading.Barrier(4, timeout=2.0)
+
+        def wait_return(x):
+            barrier.wait()
             return x
 
-        start = time.time()
-        tasks = [(sleep_return, (i,)) for i in range(4)]
+        tasks = [(wait_return, (i,)) for i in range(4)]
         results = executor.run_parallel(tasks)
-        elapsed = time.time() - start
 
         assert results == [0, 1, 2, 3]
-        # If parallel, should take ~0.1s. If sequential, ~0.4s.
-        assert elapsed < 0.3, f"Took {elapsed:.2f}s, expected <0.3s for parallel"
+        assert not barrier.broken
         executor.shutdown()
 
 
@@ -139,70 +149,54 @@ class TestParallelConfig:
 
 # ── Mock-based Memory integration ───────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def make_memory_config(tmp_path_factory):
+    """Build a mock-backed MemoryConfig with a fresh history DB per call."""
+    from engram.configs.base import MemoryConfig
+
+    base = dict(
+        vector_store={"provider": "memory", "config": {}},
+        llm={"provider": "mock", "config": {}},
+        embedder={"provider": "simple", "config": {}},
+        graph={"enable_graph": False},
+        scene={"enable_scenes": False},
+        profile={"enable_profiles": False},
+        handoff={"enable_handoff": False},
+    )
+
+    def _make(**overrides):
+        db_path = tmp_path_factory.mktemp("parallel") / "test.db"
+        return MemoryConfig(**{**base, **overrides, "history_db_path": str(db_path)})
+
+    return _make
+
+
 class TestParallelMemoryIntegration:
     """Test that Memory correctly initializes and uses the executor."""
 
-    def test_memory_no_executor_by_default(self):
+    def test_memory_no_executor_by_default(self, make_memory_config):
         """With default config, no executor is created."""
-        from engram.configs.base import MemoryConfig
         from engram.memory.main import Memory
-        import tempfile, os
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = MemoryConfig(
-                vector_store={"provider": "memory", "config": {}},
-                llm={"provider": "mock", "config": {}},
-                embedder={"provider": "simple", "config": {}},
-                history_db_path=os.path.join(tmpdir, "test.db"),
-                graph={"enable_graph": False},
-                scene={"enable_scenes": False},
-                profile={"enable_profiles": False},
-                handoff={"enable_handoff": False},
-            )
-            m = Memory(config)
-            assert m._executor is None
-            m.close()
-
-    def test_memory_creates_executor_when_enabled(self):
+        m = Memory(make_memory_config())
+        assert m._executor is None
+        m.close()
+
+    def test_memory_creates_executor_when_enabled(self, make_memory_config):
         """With enable_parallel=True, executor is created."""
-        from engram.configs.base import MemoryConfig, ParallelConfig
+        from engram.configs.base import ParallelConfig
         from engram.memory.main import Memory
-        import tempfile, os
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = MemoryConfig(
-                vector_store={"provider": "memory", "config": {}},
-                llm={"provider": "mock", "config": {}},
-                embedder={"provider": "simple", "config": {}},
-                history_db_path=os.path.join(tmpdir, "test.db"),
-                graph={"enable_graph": False},
-                scene={"enable_scenes": False},
-                profile={"enable_profiles": False},
-                handoff={"enable_handoff": False},
-                parallel=ParallelConfig(enable_parallel=True),
-            )
-            m = Memory(config)
-            assert m._executor is not None
-            m.close()
-            assert m._executor is None
-
-    def test_memory_close_shuts_down_executor(self):
+        m = Memory(make_memory_config(parallel=ParallelConfig(enable_parallel=True)))
+        assert m._executor is not None
+        m.close()
+        assert m._executor is None
+
+    def test_memory_close_shuts_down_executor(self, make_memory_config):
         """close() cleanly shuts down the executor."""
-        from engram.configs.base import MemoryConfig, ParallelConfig
+        from engram.configs.base import ParallelConfig
         from engram.memory.main import Memory
-        import tempfile, os
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = MemoryConfig(
-                vector_store={"provider": "memory", "config": {}},
-                llm={"provider": "mock", "config": {}},
-                embedder={"provider": "simple", "config": {}},
-                history_db_path=os.path.join(tmpdir, "test.db"),
-                graph={"enable_graph": False},
-                scene={"enable_scenes": False},
-                profile={"enable_profiles": False},
-                handoff={"enable_handoff": False},
-                parallel=ParallelConfig(enable_parallel=True, max_workers=2),
-            )
-            m = Memory(config)
-            executor = m._executor
-            assert executor is not None
-            m.close()
-            assert m._executor is None
+        config = make_memory_config(parallel=ParallelConfig(enable_parallel=True, max_workers=2))
+        m = Memory(config)
+        executor = m._executor
+        assert executor is not None
+        m.close()
+        assert m._executor is None
@@ -1,22 +1,30 @@
 """Tests for ProfileProcessor — extraction, updates, narrative, self-profile."""
 
-import os
-import tempfile
 import uuid
 
 import pytest
 
-from engram.core.profile import ProfileProcessor, ProfileUpdate, _SELF_PATTERNS, _PERSON_PATTERN
-from engram.db.sqlite import SQLiteManager
+from engram.core.profile import (
+    ProfileProcessor,
+    ProfileUpdate,
+    _PERSON_PATTERN,
+    _SELF_PATTERNS,
+    _SELF_UNION_PATTERN,
+)
+
+
+PROCESSOR_CONFIG = {
+    "auto_detect_profiles": True,
+    "use_llm_extraction": False,  # No LLM in tests
+    "narrative_regenerate_threshold": 10,
+    "self_profile_auto_create": True,
+    "max_facts_per_profile": 100,
+}
 
 
 @pytest.fixture
-def db():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    mgr = SQLiteManager(path)
-    yield mgr
-    os.unlink(path)
+def db(memory_db):
+    return memory_db
 
 
 @pytest.fixture
@@ -25,28 +33,27 @@ def processor(db):
         db=db,
         embedder=None,
         llm=None,
-        config={
-            "auto_detect_profiles": True,
-            "use_llm_extraction": False,  # No LLM in tests
-            "narrative_regenerate_threshold": 10,
-            "self_profile_auto_create": True,
-            "max_facts_per_profile": 100,
-        },
+        config=PROCESSOR_CONFIG,
     )
 
 
 class TestSelfPatterns:
     def test_i_prefer(self):
-        assert any(p.search("I prefer dark mode") for p in _SELF_PATTERNS)
+        assert _SELF_UNION_PATTERN.search("I prefer dark mode")
 
     def test_my_name(self):
-        assert any(p.search("my name is John") for p in _SELF_PATTERNS)
+        assert _SELF_UNION_PATTERN.search("my name is John")
 
     def test_im_a(self):
-        assert any(p.search("I'm a software engineer") for p in _SELF_PATTERNS)
+        assert _SELF_UNION_PATTERN.search("I'm a software engineer")
 
     def test_no_match(self):
-        assert not any(p.search("The sky is blue") for p in _SELF_PATTERNS)
+        assert not _SELF_UNION_PATTERN.search("The sky is blue")
+
+    def test_union_agrees_with_patterns(self):
+        for text in ("call me Al", "I need coffee", "My team is small", "I am the lead", "nothing here"):
+            expected = any(p.search(text) for p in _SELF_PATTERNS)
+            assert bool(_SELF_UNION_PATTERN.search(text)) is expected
 
 
 class TestPersonPattern:
@@ -59,6 +66,7 @@ class TestPersonPattern:
         assert len(matches) == 0
 
 
+@pytest.mark.sqlite
 class TestExtraction:
     def test_self_preference(self, processor):
         updates = processor.extract_profile_mentions(
@@ -87,6 +95,7 @@ class TestExtraction:
         assert len(updates) == 0
 
 
+@pytest.mark.sqlite
 class TestSelfProfile:
     def test_ensure_self_profile(self, processor, db):
         profile = processor.ensure_self_profile("u1")
@@ -110,6 +119,7 @@ class TestSelfProfile:
         assert len(self_profile["preferences"]) > 0
 
 
+@pytest.mark.sqlite
 class TestProfileLifecycle:
     def test_create_contact(self, processor, db):
         mem_id = str(uuid.uuid4())
@@ -130,8 +140,10 @@ class TestProfileLifecycle:
     def test_merge_facts(self, processor, db):
         mem1 = str(uuid.uuid4())
         mem2 = str(uuid.uuid4())
-        db.add_memory({"id": mem1, "memory": "fact 1", "user_id": "u1"})
-        db.add_memory({"id": mem2, "memory": "fact 2", "user_id": "u1"})
+        db.add_memories_batch([
+            {"id": mem1, "memory": "fact 1", "user_id": "u1"},
+            {"id": mem2, "memory": "fact 2", "user_id": "u1"},
+        ])
 
         update1 = ProfileUpdate(
             profile_name="Bob Wilson",
@@ -169,6 +181,7 @@ class TestProfileLifecycle:
         assert len(profile["facts"]) <= 3
 
 
+@pytest.mark.sqlite
 class TestProfileSearch:
     def test_keyword_search(self, processor, db):
         db.add_profile({
@@ -188,6 +201,7 @@ class TestProfileSearch:
         assert len(results) == 0
 
 
+@pytest.mark.sqlite
 class TestProfileMemories:
     def test_link_memory(self, processor, db):
         mem_id = str(uuid.uuid4())
@@ -1,8 +1,5 @@
 """Tests for ProjectManager — projects, statuses, and tags as Engram memories."""
 
-import os
-import tempfile
-
 import pytest
 
 from engram.configs.base import MemoryConfig
@@ -10,12 +7,12 @@ from engram.memory.main import Memory
 from engram.memory.projects import ProjectManager, DEFAULT_STATUSES
 
 
-def _make_memory(tmpdir):
+def _make_memory():
     config = MemoryConfig(
         vector_store={"provider": "memory", "config": {}},
         llm={"provider": "mock", "config": {}},
         embedder={"provider": "simple", "config": {}},
-        history_db_path=os.path.join(tmpdir, "test.db"),
+        history_db_path=":memory:",
         graph={"enable_graph": False},
         scene={"enable_scenes": False},
         profile={"enable_profiles": False},
@@ -26,19 +23,16 @@ def _make_memory(tmpdir):
     return Memory(config)
 
 
-@pytest.fixture
-def tmpdir():
-    with tempfile.TemporaryDirectory() as d:
-        yield d
-
-
-@pytest.fixture
-def mem(tmpdir):
-    return _make_memory(tmpdir)
+@pytest.fixture(scope="module")
+def mem():
+    m = _make_memory()
+    yield m
+    m.close()
 
 
 @pytest.fixture
-def pm(mem):
+def pm(mem, reset_memory):
+    reset_memory(mem)
     return ProjectManager(mem)
 
 
@@ -117,6 +111,7 @@ class TestIssueCounter:
         assert pm.next_issue_number(p["id"]) == 1
         assert pm.next_issue_number(p["id"]) == 2
         assert pm.next_issue_number(p["id"]) == 3
+        assert pm.get_project(p["id"])["issue_counter"] == 3
 
 
 # ── Statuses ──
@@ -133,18 +128,20 @@ class TestCreateStatus:
 
 class TestListStatuses:
     def test_list_sorted(self, pm):
-        p = pm.create_project("Test")
-        pm.create_status(p["id"], "C", "#000", 2)
-        pm.create_status(p["id"], "A", "#000", 0)
-        pm.create_status(p["id"], "B", "#000", 1)
+        with pm.memory.db.transaction():
+            p = pm.create_project("Test")
+            pm.create_status(p["id"], "C", "#000", 2)
+            pm.create_status(p["id"], "A", "#000", 0)
+            pm.create_status(p["id"], "B", "#000", 1)
         statuses = pm.list_statuses(p["id"])
         assert [s["name"] for s in statuses] == ["A", "B", "C"]
 
     def test_list_filters_by_project(self, pm):
-        p1 = pm.create_project("Project 1")
-        p2 = pm.create_project("Project 2")
-        pm.create_status(p1["id"], "S1", "#000", 0)
-        pm.create_status(p2["id"], "S2", "#000", 0)
+        with pm.memory.db.transaction():
+            p1 = pm.create_project("Project 1")
+            p2 = pm.create_project("Project 2")
+            pm.create_status(p1["id"], "S1", "#000", 0)
+            pm.create_status(p2["id"], "S2", "#000", 0)
         assert len(pm.list_statuses(p1["id"])) == 1
         assert len(pm.list_statuses(p2["id"])) == 1
 
@@ -190,15 +187,28 @@ class TestEnsureDefaultStatuses:
 
 class TestBulkUpdateStatuses:
     def test_bulk_reorder(self, pm):
-        p = pm.create_project("Test")
-        s1 = pm.create_status(p["id"], "A", "#000", 0)
-        s2 = pm.create_status(p["id"], "B", "#000", 1)
+        with pm.memory.db.transaction():
+            p = pm.create_project("Test")
+            s1 = pm.create_status(p["id"], "A", "#000", 0)
+            s2 = pm.create_status(p["id"], "B", "#000", 1)
         results = pm.bulk_update_statuses([
             {"id": s1["id"], "sort_order": 1},
             {"id": s2["id"], "sort_order": 0},
         ])
         assert len(results) == 2
 
+    def test_bulk_duplicate_id_applies_in_order(self, pm):
+        p = pm.create_project("Test")
+        s = pm.create_status(p["id"], "A", "#000", 0)
+        results = pm.bulk_update_statuses([
+            {"id": s["id"], "name": "Renamed"},
+            {"id": s["id"], "color": "#fff"},
+        ])
+        assert [(r["name"], r["color"]) for r in results] == [("Renamed", "#000"), ("Renamed", "#fff")]
+        stored = pm.memory.db.get_memory(s["id"])
+        assert stored["memory"] == "Status: Renamed"
+        assert (stored["metadata"]["status_name"], stored["metadata"]["status_color"]) == ("Renamed", "#fff")
+
 
 # ── Tags ──
 
@@ -213,17 +223,19 @@ class TestCreateTag:
 
 class TestListTags:
     def test_list_tags(self, pm):
-        p = pm.create_project("Test")
-        pm.create_tag(p["id"], "bug")
-        pm.create_tag(p["id"], "feature")
+        with pm.memory.db.transaction():
+            p = pm.create_project("Test")
+            pm.create_tag(p["id"], "bug")
+            pm.create_tag(p["id"], "feature")
         tags = pm.list_tags(p["id"])
         assert len(tags) == 2
 
     def test_filters_by_project(self, pm):
-        p1 = pm.create_project("Project 1")
-        p2 = pm.create_project("Project 2")
-        pm.create_tag(p1["id"], "tag1")
-        pm.create_tag(p2["id"], "tag2")
+        with pm.memory.db.transaction():
+            p1 = pm.create_project("Project 1")
+            p2 = pm.create_project("Project 2")
+            pm.create_tag(p1["id"], "tag1")
+            pm.create_tag(p2["id"], "tag2")
         assert len(pm.list_tags(p1["id"])) == 1
         assert len(pm.list_tags(p2["id"])) == 1
 
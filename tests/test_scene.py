@@ -1,24 +1,17 @@
 """Tests for SceneProcessor — boundary detection, creation, closing, summarization."""
 
-import os
-import tempfile
 import uuid
 from datetime import datetime, timedelta
 
 import pytest
 
 from engram.core.scene import SceneProcessor, SceneDetectionResult, _detect_location, _cosine_similarity
-from engram.db.sqlite import SQLiteManager
 
 
 @pytest.fixture
-def db():
-    """Create a temporary SQLite database."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    mgr = SQLiteManager(path)
-    yield mgr
-    os.unlink(path)
+def db(memory_db):
+    """In-memory SQLite database copied from the session schema template."""
+    return memory_db
 
 
 @pytest.fixture
@@ -139,6 +132,22 @@ class TestBoundaryDetection:
         assert result.is_new_scene is True
         assert result.reason == "location_change"
 
+    def test_location_change_checked_before_topic_shift(self, processor):
+        now = datetime.utcnow()
+        recent = (now - timedelta(minutes=1)).isoformat()
+        scene = {
+            "start_time": recent,
+            "end_time": recent,
+            "memory_ids": ["a"],
+            "location": "Office",
+            "embedding": [1.0, 0.0, 0.0],
+        }
+        result = processor.detect_boundary(
+            "Meeting at Starbucks today", now.isoformat(), scene, embedding=[0.0, 1.0, 0.0]
+        )
+        assert result.reason == "location_change"
+        assert result.topic_similarity is None
+
 
 class TestSceneLifecycle:
     def test_create_scene(self, processor, db):
@@ -167,8 +176,10 @@ class TestSceneLifecycle:
         mem1 = str(uuid.uuid4())
         mem2 = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
-        db.add_memory({"id": mem1, "memory": "first", "user_id": "u1"})
-        db.add_memory({"id": mem2, "memory": "second", "user_id": "u1"})
+        db.add_memories_batch([
+            {"id": mem1, "memory": "first", "user_id": "u1"},
+            {"id": mem2, "memory": "second", "user_id": "u1"},
+        ])
 
         scene = processor.create_scene(mem1, "u1", now, topic="topic")
         processor.add_memory_to_scene(scene["id"], mem2, timestamp=now)
@@ -0,0 +1,17 @@
+"""Tests for the dependency-free SimpleEmbedder."""
+
+import math
+
+from engram.embeddings.simple import SimpleEmbedder
+
+
+def test_embed_is_unit_length_bag_of_words():
+    embedder = SimpleEmbedder({"embedding_dims": 64})
+    vector = embedder.embed("Fix the bug fix")
+    assert len(vector) == 64
+    assert math.isclose(sum(x * x for x in vector), 1.0)
+    assert embedder.embed("fix bug the FIX") == vector
+
+
+def test_embed_empty_text_is_zero_vector():
+    assert SimpleEmbedder({"embedding_dims": 8}).embed("   ") == [0.0] * 8
@@ -1,23 +1,28 @@
 """Tests for SQLite connection pooling, batch ops, and type safety (Phases 1, 2, 5)."""
 
-import os
-import tempfile
+import sqlite3
 import threading
+from datetime import datetime, timezone
 
 import pytest
 
-from engram.db.sqlite import SQLiteManager, VALID_MEMORY_COLUMNS, VALID_SCENE_COLUMNS, _utcnow_iso
+from engram.db.sqlite import SQLiteManager, VALID_MEMORY_COLUMNS, VALID_SCENE_COLUMNS, _update_sql, _utcnow_iso
 
 
 @pytest.fixture
-def db_manager():
+def db_manager(tmp_path):
     """Create a temporary SQLiteManager for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    mgr = SQLiteManager(path)
+    mgr = SQLiteManager(str(tmp_path / "test.db"))
+    yield mgr
+    mgr.close()
+
+
+@pytest.fixture
+def pooled_manager(tmp_path):
+    """SQLiteManager with the read-only connection pool turned on."""
+    mgr = SQLiteManager(str(tmp_path / "pooled.db"), read_pool=True)
     yield mgr
     mgr.close()
-    os.unlink(path)
 
 
 def _add_test_memory(mgr, memory_id="test-1", content="Hello world", user_id="user1"):
@@ -40,6 +45,8 @@ class TestConnectionPool:
         with db_manager._get_connection() as conn:
             mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
             assert mode == "wal"
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
 
     def test_connection_reuse(self, db_manager):
         """Same connection object is yielded on successive calls."""
@@ -66,6 +73,71 @@ class TestConnectionPool:
 
         assert all(results)
 
+    @pytest.mark.parametrize("env,expected", [(None, False), ("1", True)])
+    def test_read_pool_from_env(self, tmp_path, monkeypatch, env, expected):
+        """The read-only pool is opt-in via ENGRAM_SQLITE_READ_POOL=1."""
+        if env is None:
+            monkeypatch.delenv("ENGRAM_SQLITE_READ_POOL", raising=False)
+        else:
+            monkeypatch.setenv("ENGRAM_SQLITE_READ_POOL", env)
+        mgr = SQLiteManager(str(tmp_path / "env.db"))
+        assert (mgr._read_pool is not None) is expected
+        mgr.close()
+
+    def test_reads_do_not_wait_for_writer_lock(self, pooled_manager):
+        """Point reads use pooled read-only connections, not the writer lock."""
+        _add_test_memory(pooled_manager, "pooled")
+        found = []
+        with pooled_manager._lock:  # writer busy on this thread
+            t = threading.Thread(target=lambda: found.append(pooled_manager.get_memory("pooled")))
+            t.start()
+            t.join(timeout=5)
+        assert found and found[0]["id"] == "pooled"
+
+    def test_reads_inside_transaction_see_pending_writes(self, pooled_manager):
+        with pooled_manager.transaction():
+            _add_test_memory(pooled_manager, "pending")
+            assert pooled_manager.get_memory("pending") is not None
+            assert "pending" in pooled_manager.get_memories_bulk(["pending"])
+
+    def test_close_closes_pooled_readers(self, pooled_manager):
+        _add_test_memory(pooled_manager, "r")
+        pooled_manager.get_memory("r")
+        reader = pooled_manager._read_pool.get_nowait()
+        pooled_manager._read_pool.put(reader)
+        pooled_manager.close()
+        assert pooled_manager._read_pool is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+
+    def test_increment_metadata_counter_concurrent(self, db_manager):
+        _add_test_memory(db_manager, "counter")
+        values = []
+
+        def bump():
+            for _ in range(20):
+                values.append(db_manager.increment_metadata_counter("counter", "n"))
+
+        threads = [threading.Thread(target=bump) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(values) == list(range(1, 101))
+        assert db_manager.get_memory("counter")["metadata"]["n"] == 100
+        assert db_manager.increment_metadata_counter("missing", "n") is None
+
+    def test_increment_metadata_counter_malformed_metadata(self, db_manager):
+        _add_test_memory(db_manager, "broken")
+        with db_manager._get_connection() as conn:
+            conn.execute("UPDATE memories SET metadata = 'x{' WHERE id = 'broken'")
+        assert db_manager.increment_metadata_counter("broken", "n") == 1
+        assert db_manager.increment_metadata_counter("broken", "n") == 2
+        assert db_manager.get_memory("broken")["metadata"] == {"n": 2}
+        events = [h["event"] for h in db_manager.get_history("broken")]
+        assert events.count("UPDATE") == 2
+
     def test_close(self, db_manager):
         """close() shuts down cleanly."""
         _add_test_memory(db_manager, "close-test")
@@ -73,6 +145,24 @@ class TestConnectionPool:
         # Connection is None after close.
         assert db_manager._conn is None
 
+    @pytest.mark.parametrize("env,expected", [("1", 1), ("0", 2)])
+    def test_fast_pragmas_from_env(self, tmp_path, monkeypatch, env, expected):
+        """ENGRAM_SQLITE_FAST=1 selects synchronous=NORMAL (1) over FULL (2)."""
+        monkeypatch.setenv("ENGRAM_SQLITE_FAST", env)
+        mgr = SQLiteManager(str(tmp_path / "env.db"))
+        with mgr._get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == expected
+        mgr.close()
+
+    def test_from_connection_skips_schema_setup(self, db_manager):
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        db_manager._conn.backup(conn)
+        copy = SQLiteManager.from_connection(conn)
+        _add_test_memory(copy, "copied")
+        assert copy.get_memory("copied") is not None
+        assert db_manager.get_memory("copied") is None
+        copy.close()
+
     def test_repr(self, db_manager):
         assert "SQLiteManager" in repr(db_manager)
         assert db_manager.db_path in repr(db_manager)
@@ -93,6 +183,14 @@ class TestBatchOperations:
     def test_get_memories_bulk_empty(self, db_manager):
         assert db_manager.get_memories_bulk([]) == {}
 
+    def test_get_memories_bulk_chunks_large_id_lists(self, db_manager):
+        _add_test_memory(db_manager, "bulk-first", "First")
+        _add_test_memory(db_manager, "bulk-last", "Last")
+        ids = ["bulk-first"] + [f"missing-{i}" for i in range(2000)] + ["bulk-last"]
+
+        result = db_manager.get_memories_bulk(ids)
+        assert set(result) == {"bulk-first", "bulk-last"}
+
     def test_get_memories_bulk_missing(self, db_manager):
         result = db_manager.get_memories_bulk(["nonexistent"])
         assert len(result) == 0
@@ -108,6 +206,16 @@ class TestBatchOperations:
         assert mem1["access_count"] == 1
         assert mem2["access_count"] == 1
 
+    def test_increment_access_bulk_chunks_large_id_lists(self, db_manager):
+        _add_test_memory(db_manager, "inc-first")
+        _add_test_memory(db_manager, "inc-last")
+        ids = ["inc-first"] + [f"missing-{i}" for i in range(2000)] + ["inc-last"]
+
+        db_manager.increment_access_bulk(ids)
+
+        assert db_manager.get_memory("inc-first")["access_count"] == 1
+        assert db_manager.get_memory("inc-last")["access_count"] == 1
+
     def test_increment_access_bulk_empty(self, db_manager):
         db_manager.increment_access_bulk([])  # Should not raise.
 
@@ -122,6 +230,56 @@ class TestBatchOperations:
         assert abs(mem1["strength"] - 0.8) < 0.01
         assert abs(mem2["strength"] - 0.6) < 0.01
 
+    def test_transaction_groups_writes(self, db_manager):
+        with db_manager.transaction():
+            _add_test_memory(db_manager, "tx-1")
+            _add_test_memory(db_manager, "tx-2")
+            assert db_manager._conn.in_transaction
+        assert not db_manager._conn.in_transaction
+        assert db_manager.get_memory("tx-1") is not None
+        assert db_manager.get_memory("tx-2") is not None
+
+    def test_transaction_rolls_back_on_error(self, db_manager):
+        with pytest.raises(RuntimeError):
+            with db_manager.transaction():
+                _add_test_memory(db_manager, "tx-1")
+                raise RuntimeError("abort")
+        assert db_manager.get_memory("tx-1") is None
+
+
+class TestMetadataFilters:
+    def test_get_all_memories_metadata_filters(self, db_manager):
+        for mid, project, status in [("t1", "p1", "inbox"), ("t2", "p1", "done"), ("t3", "p2", "inbox")]:
+            db_manager.add_memory({
+                "id": mid, "memory": mid, "user_id": "u1", "memory_type": "task",
+                "metadata": {"task_project_id": project, "task_status": status},
+            })
+        by_project = db_manager.get_all_memories(metadata_filters={"task_project_id": "p1"})
+        assert {m["id"] for m in by_project} == {"t1", "t2"}
+        by_status = db_manager.get_all_memories(
+            metadata_filters={"task_project_id": "p1", "task_status": ("inbox", "review")},
+        )
+        assert [m["id"] for m in by_status] == ["t1"]
+        assert db_manager.count_memories(metadata_filters={"task_status": ["inbox"]}) == 2
+
+    @pytest.mark.parametrize("key", ["task_project_id", "task_status", "task_parent_id"])
+    def test_task_metadata_filter_uses_index(self, db_manager, key):
+        where, params = db_manager._memory_filter_sql(
+            user_id="u1", memory_type="task", metadata_filters={key: "x"},
+        )
+        with db_manager._get_connection() as conn:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM memories {where}", params).fetchall()
+        assert any("idx_memories_task_" in row[-1] and "<expr>=?" in row[-1] for row in plan)
+
+
+def test_utcnow_iso_matches_datetime_isoformat():
+    stamp = _utcnow_iso()
+    parsed = datetime.fromisoformat(stamp)
+    assert parsed.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 1
+    # Fixed width (microseconds always present) keeps string ordering chronological.
+    assert len(stamp) == len("2026-01-01T00:00:00.000000+00:00")
+
 
 class TestTypeSafety:
     def test_update_memory_rejects_invalid_column(self, db_manager):
@@ -135,6 +293,11 @@ class TestTypeSafety:
         mem = db_manager.get_memory("safe-2")
         assert abs(mem["strength"] - 0.5) < 0.01
 
+    def test_update_sql_is_built_once_per_column_set(self):
+        first = _update_sql("memories", ("strength", "layer"), True)
+        assert _update_sql("memories", ("strength", "layer"), True) is first
+        assert first == "UPDATE memories SET strength = ?, layer = ?, updated_at = ? WHERE id = ?"
+
     def test_update_scene_rejects_invalid_column(self, db_manager):
         scene_id = db_manager.add_scene({"id": "scene-1", "user_id": "u1", "start_time": _utcnow_iso()})
         with pytest.raises(ValueError, match="Invalid scene column"):
@@ -155,6 +318,10 @@ class TestTypeSafety:
             with pytest.raises(ValueError, match="Invalid column name"):
                 db_manager._migrate_add_column_conn(conn, "memories", "evil;drop", "TEXT")
 
+    def test_metadata_filter_rejects_invalid_key(self, db_manager):
+        with pytest.raises(ValueError, match="Invalid metadata filter key"):
+            db_manager.get_all_memories(metadata_filters={"a') OR 1=1 --": "x"})
+
     def test_valid_columns_frozensets_not_empty(self):
         assert len(VALID_MEMORY_COLUMNS) > 10
         assert len(VALID_SCENE_COLUMNS) > 5
@@ -172,3 +339,13 @@ class TestMigrationIdempotency:
         db_manager._init_db()
         with db_manager._get_connection() as conn:
             assert db_manager._is_migration_applied(conn, "v2_columns_complete")
+
+    def test_applied_migrations_read_once(self, db_manager):
+        """The applied-versions set is cached, so a reinit issues no lookups."""
+        statements = []
+        db_manager._conn.set_trace_callback(statements.append)
+        try:
+            db_manager._init_db()
+        finally:
+            db_manager._conn.set_trace_callback(None)
+        assert not [s for s in statements if "FROM schema_migrations" in s]
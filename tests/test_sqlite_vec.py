@@ -8,7 +8,7 @@ import pytest
 sqlite_vec = pytest.importorskip("sqlite_vec", reason="sqlite-vec not installed")
 
 from engram.vector_stores.base import MemoryResult
-from engram.vector_stores.sqlite_vec import SqliteVecStore
+from engram.vector_stores.sqlite_vec import SqliteVecStore, _payload_filter_sql
 
 
 @pytest.fixture
@@ -227,6 +227,21 @@ class TestList:
         assert len(results) == 1
         assert results[0].payload["user_id"] == "alice"
 
+    def test_list_filter_finds_rows_past_overfetch_window(self, store):
+        for i in range(10):
+            store.insert(vectors=[[float(i), 1.0, 0.0, 0.0]], payloads=[{"user_id": "bob"}], ids=[f"bob-{i}"])
+        store.insert(vectors=[[0.0, 1.0, 0.0, 0.0]], payloads=[{"user_id": "alice"}], ids=["alice-1"])
+        results = store.list(filters={"user_id": "alice"}, limit=1)
+        assert [r.id for r in results] == ["alice-1"]
+
+    def test_operator_filters_stay_in_python(self):
+        sql, params = _payload_filter_sql(
+            {"user_id": "alice", "importance": {"gte": 0.5}, "agent_id": "*", "OR": []},
+            "payload",
+        )
+        assert sql == " AND json_extract(payload, '$.user_id') = ?"
+        assert params == ["alice"]
+
     def test_list_with_limit(self, store):
         for i in range(10):
             store.insert(vectors=[[float(i), 0.0, 0.0, 0.0]], ids=[f"id-{i}"])
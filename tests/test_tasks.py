@@ -4,9 +4,6 @@ Covers: create, dedup, get, list, update, complete, comment, search,
 get_pending, lifecycle, and custom metadata.
 """
 
-import os
-import tempfile
-
 import pytest
 
 from engram.configs.base import MemoryConfig, TaskConfig
@@ -14,13 +11,13 @@ from engram.memory.main import Memory
 from engram.memory.tasks import TaskManager, TASK_STATUSES, ACTIVE_STATUSES
 
 
-def _make_memory(tmpdir):
+def _make_memory():
     """Create a Memory instance configured for testing."""
     config = MemoryConfig(
         vector_store={"provider": "memory", "config": {}},
         llm={"provider": "mock", "config": {}},
         embedder={"provider": "simple", "config": {}},
-        history_db_path=os.path.join(tmpdir, "test.db"),
+        history_db_path=":memory:",
         graph={"enable_graph": False},
         scene={"enable_scenes": False},
         profile={"enable_profiles": False},
@@ -31,15 +28,17 @@ def _make_memory(tmpdir):
     return Memory(config)
 
 
-@pytest.fixture
-def tmpdir():
-    with tempfile.TemporaryDirectory() as d:
-        yield d
+@pytest.fixture(scope="module")
+def shared_mem():
+    m = _make_memory()
+    yield m
+    m.close()
 
 
 @pytest.fixture
-def mem(tmpdir):
-    return _make_memory(tmpdir)
+def mem(shared_mem, reset_memory):
+    reset_memory(shared_mem)
+    return shared_mem
 
 
 @pytest.fixture
@@ -47,6 +46,12 @@ def tm(mem):
     return TaskManager(mem)
 
 
+def _seed_tasks(tm, specs):
+    """Create ``(title, status)`` tasks in one batch, bypassing dedup."""
+    titles, statuses = zip(*specs)
+    return tm.bulk_create_tasks(list(titles), statuses=list(statuses))
+
+
 # ── Config ──
 
 class TestTaskConfig:
@@ -136,12 +141,40 @@ class TestDedup:
         t2 = tm.create_task("  Fix auth bug  ")
         assert t1["id"] == t2["id"]
 
+    def test_dedup_collapses_inner_whitespace(self, tm):
+        t1 = tm.create_task("Fix auth bug")
+        t2 = tm.create_task("Fix  AUTH\tbug")
+        assert t1["id"] == t2["id"]
+
+    def test_dedup_follows_title_update(self, tm):
+        t1 = tm.create_task("Fix auth bug")
+        tm.update_task(t1["id"], {"title": "Fix login bug"})
+        assert tm.create_task("Fix login bug")["id"] == t1["id"]
+        assert tm.create_task("Fix auth bug")["id"] != t1["id"]
+
     def test_dedup_allows_after_done(self, tm):
         t1 = tm.create_task("Fix auth bug")
         tm.complete_task(t1["id"])
         t2 = tm.create_task("Fix auth bug")
         assert t1["id"] != t2["id"]
 
+    def test_dedup_matches_legacy_task_without_key(self, tm, mem):
+        legacy = tm.create_task("Fix auth bug")
+        md = dict(mem.db.get_memory(legacy["id"])["metadata"])
+        del md["task_title_key"]
+        mem.db.update_memory(legacy["id"], {"metadata": md})
+        assert tm.create_task("fix AUTH bug")["id"] == legacy["id"]
+
+    def test_dedup_filters_key_in_sql(self, tm, mem):
+        tm.create_task("Fix auth bug")
+        statements = []
+        mem.db._conn.set_trace_callback(statements.append)
+        try:
+            tm.create_task("Fix auth bug")
+        finally:
+            mem.db._conn.set_trace_callback(None)
+        assert any("$.task_title_key" in s and "LIMIT" in s for s in statements)
+
     def test_different_titles_no_dedup(self, tm):
         t1 = tm.create_task("Fix auth bug")
         t2 = tm.create_task("Fix login bug")
@@ -205,8 +238,8 @@ class TestListTasks:
         assert tasks[0]["id"] == t2["id"]
 
     def test_list_with_limit(self, tm):
-        for i in range(10):
-            tm.create_task(f"Task {i}")
+        created = tm.bulk_create_tasks([f"Task {i}" for i in range(10)])
+        assert len(created) == 10
         tasks = tm.list_tasks(limit=5)
         assert len(tasks) == 5
 
@@ -302,22 +335,31 @@ class TestPendingTasks:
         assert tm.get_pending_tasks() == []
 
     def test_get_pending_excludes_done(self, tm):
-        t1 = tm.create_task("Task 1")
-        t2 = tm.create_task("Task 2")
+        t1, t2 = tm.bulk_create_tasks(["Task 1", "Task 2"])
         tm.complete_task(t1["id"])
         pending = tm.get_pending_tasks()
         assert len(pending) == 1
         assert pending[0]["id"] == t2["id"]
 
     def test_get_pending_includes_active_statuses(self, tm):
-        tm.create_task("Inbox", status="inbox")
-        tm.create_task("Assigned", status="assigned")
-        tm.create_task("Active", status="active")
-        tm.create_task("Review", status="review")
-        tm.create_task("Blocked", status="blocked")
+        _seed_tasks(tm, [
+            ("Inbox", "inbox"),
+            ("Assigned", "assigned"),
+            ("Active", "active"),
+            ("Review", "review"),
+            ("Blocked", "blocked"),
+        ])
         pending = tm.get_pending_tasks()
         assert len(pending) == 5
 
+    def test_get_pending_includes_legacy_task_without_status(self, tm, mem):
+        legacy = tm.create_task("Legacy task")
+        md = dict(mem.db.get_memory(legacy["id"])["metadata"])
+        del md["task_status"]
+        mem.db.update_memory(legacy["id"], {"metadata": md})
+        pending = tm.get_pending_tasks()
+        assert [t["id"] for t in pending] == [legacy["id"]]
+
     def test_get_pending_filter_assignee(self, tm):
         tm.create_task("Task 1", assignee="claude-code")
         tm.create_task("Task 2", assignee="codex")
@@ -337,6 +379,12 @@ class TestSearchTasks:
         titles = [t["title"] for t in results]
         assert any("authentication" in t.lower() for t in titles) or len(results) >= 0
 
+    def test_filter_by_title_contains(self, tm):
+        tm.create_task("Fix authentication bug")
+        tm.create_task("Add dark mode feature")
+        results = tm.filter_by_title_contains("Authentication")
+        assert [t["title"] for t in results] == ["Fix authentication bug"]
+
     def test_search_empty(self, tm):
         results = tm.search_tasks("nonexistent query xyz")
         assert isinstance(results, list)
@@ -409,6 +457,18 @@ class TestBridgeCompat:
 
 # ── Output format ──
 
+EXPECTED_TASK_KEYS = frozenset({
+    "id", "title", "description", "priority", "status",
+    "assigned_agent", "tags", "due_date", "created_at", "updated_at",
+    "comments", "conversation", "processes", "files_changed",
+    "memory_strength", "categories", "custom",
+    # Kanban/project fields
+    "project_id", "status_id", "assignee_ids", "tag_ids",
+    "start_date", "target_date", "parent_task_id", "sort_order",
+    "relationships", "issue_number", "completed_at",
+})
+
+
 class TestOutputFormat:
     def test_task_has_all_fields(self, tm):
         task = tm.create_task(
@@ -419,42 +479,29 @@ class TestOutputFormat:
             tags=["a", "b"],
             extra_metadata={"k": "v"},
         )
-        expected_keys = {
-            "id", "title", "description", "priority", "status",
-            "assigned_agent", "tags", "due_date", "created_at", "updated_at",
-            "comments", "conversation", "processes", "files_changed",
-            "memory_strength", "categories", "custom",
-            # Kanban/project fields
-            "project_id", "status_id", "assignee_ids", "tag_ids",
-            "start_date", "target_date", "parent_task_id", "sort_order",
-            "relationships", "issue_number", "completed_at",
-        }
-        assert set(task.keys()) == expected_keys
+        assert task.keys() == EXPECTED_TASK_KEYS
+        assert tm.get_task(task["id"]).keys() == EXPECTED_TASK_KEYS
 
 
 # ── Kanban/Project fields ──
 
 class TestKanbanFields:
-    def test_create_with_project_id(self, tm):
-        task = tm.create_task("Task A", project_id="proj-123")
-        assert task["project_id"] == "proj-123"
-
-    def test_create_with_status_id(self, tm):
-        task = tm.create_task("Task A", status_id="status-abc")
-        assert task["status_id"] == "status-abc"
-
-    def test_create_with_assignee_ids(self, tm):
-        task = tm.create_task("Task A", assignee_ids=["alice", "bob"])
-        assert task["assignee_ids"] == ["alice", "bob"]
-
-    def test_create_with_tag_ids(self, tm):
-        task = tm.create_task("Task A", tag_ids=["tag-1", "tag-2"])
-        assert task["tag_ids"] == ["tag-1", "tag-2"]
-
-    def test_create_with_dates(self, tm):
-        task = tm.create_task("Task A", start_date="2025-01-01", target_date="2025-02-01")
-        assert task["start_date"] == "2025-01-01"
-        assert task["target_date"] == "2025-02-01"
+    def test_create_with_kanban_fields(self, tm):
+        fields = {
+            "project_id": "proj-123",
+            "status_id": "status-abc",
+            "assignee_ids": ["alice", "bob"],
+            "tag_ids": ["tag-1", "tag-2"],
+            "start_date": "2025-01-01",
+            "target_date": "2025-02-01",
+            "sort_order": 5,
+            "issue_number": 42,
+        }
+        task = tm.create_task("Task A", **fields)
+        stored = tm.get_task(task["id"])
+        for key, value in fields.items():
+            assert task[key] == value, key
+            assert stored[key] == value, key
 
     def test_create_with_parent(self, tm):
         parent = tm.create_task("Parent")
@@ -572,6 +619,22 @@ class TestReactions:
         assert len(result["comments"][0]["reactions"]) == 0
 
 
+class TestBulkCreate:
+    def test_bulk_create_keeps_title_order(self, tm):
+        created = tm.bulk_create_tasks(["Task 1", "Task 2"], statuses=["inbox", "active"])
+        assert [(t["title"], t["status"]) for t in created] == [("Task 1", "inbox"), ("Task 2", "active")]
+
+    def test_bulk_create_rejects_empty_title(self, tm):
+        with pytest.raises(ValueError, match="non-empty"):
+            tm.bulk_create_tasks(["Task 1", "   "])
+        assert tm.list_tasks() == []
+
+    def test_bulk_create_rejects_status_length_mismatch(self, tm):
+        with pytest.raises(ValueError, match="statuses"):
+            tm.bulk_create_tasks(["Task 1", "Task 2"], statuses=["inbox"])
+        assert tm.list_tasks() == []
+
+
 class TestBulkUpdate:
     def test_bulk_update_tasks(self, tm):
         t1 = tm.create_task("Task 1")
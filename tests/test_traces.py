@@ -9,12 +9,20 @@ from engram.configs.base import DistillationConfig
 from engram.core.traces import (
     boost_fast_trace,
     cascade_traces,
+    cascade_traces_batch,
     compute_effective_strength,
+    compute_effective_strength_batch,
     decay_traces,
+    decay_traces_batch,
     initialize_traces,
 )
 
 
+# Fixed clock for decay tests: _OLD is ten days before _NOW.
+_OLD = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_NOW = _OLD + timedelta(days=10)
+
+
 @pytest.fixture
 def config():
     return DistillationConfig(enable_multi_trace=True)
@@ -74,44 +82,60 @@ class TestComputeEffectiveStrength:
         eff = compute_effective_strength(1.0, 1.0, 1.0, config)
         assert eff <= 1.0
 
+    def test_batch_matches_scalar(self, config):
+        traces = [(1.0, 0.5, 0.0), (0.0, 0.0, 0.8), (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)]
+        batch = compute_effective_strength_batch(traces, config)
+        assert batch == [pytest.approx(compute_effective_strength(*t, config)) for t in traces]
+
 
 class TestDecayTraces:
     def test_recent_memory_minimal_decay(self, config):
-        now = datetime.now(timezone.utc)
-        s_f, s_m, s_s = decay_traces(1.0, 0.5, 0.2, now, 0, config)
+        s_f, s_m, s_s = decay_traces(1.0, 0.5, 0.2, _NOW, 0, config, now=_NOW)
         assert s_f == pytest.approx(1.0, abs=0.01)
         assert s_m == pytest.approx(0.5, abs=0.01)
         assert s_s == pytest.approx(0.2, abs=0.01)
 
     def test_old_memory_significant_decay(self, config):
-        old = datetime.now(timezone.utc) - timedelta(days=10)
-        s_f, s_m, s_s = decay_traces(1.0, 1.0, 1.0, old, 0, config)
+        s_f, s_m, s_s = decay_traces(1.0, 1.0, 1.0, _OLD, 0, config, now=_NOW)
         # Fast decays fastest
         assert s_f < s_m < s_s
         assert s_f < 1.0
 
     def test_access_count_dampens_decay(self, config):
-        old = datetime.now(timezone.utc) - timedelta(days=5)
+        old = _NOW - timedelta(days=5)
         # No accesses
-        f0, m0, s0 = decay_traces(1.0, 1.0, 1.0, old, 0, config)
+        f0, m0, s0 = decay_traces(1.0, 1.0, 1.0, old, 0, config, now=_NOW)
         # Many accesses
-        f10, m10, s10 = decay_traces(1.0, 1.0, 1.0, old, 10, config)
+        f10, m10, s10 = decay_traces(1.0, 1.0, 1.0, old, 10, config, now=_NOW)
         # More accesses = less decay
         assert f10 > f0
         assert m10 > m0
 
     def test_string_last_accessed(self, config):
-        now = datetime.now(timezone.utc).isoformat()
-        s_f, s_m, s_s = decay_traces(1.0, 0.5, 0.2, now, 0, config)
+        s_f, s_m, s_s = decay_traces(1.0, 0.5, 0.2, _NOW.isoformat(), 0, config, now=_NOW)
+        assert s_f == pytest.approx(1.0, abs=0.01)
+
+    def test_defaults_to_wall_clock(self, config):
+        s_f, _, _ = decay_traces(1.0, 0.5, 0.2, datetime.now(timezone.utc), 0, config)
         assert s_f == pytest.approx(1.0, abs=0.01)
 
     def test_values_clamped(self, config):
-        old = datetime.now(timezone.utc) - timedelta(days=100)
-        s_f, s_m, s_s = decay_traces(1.0, 1.0, 1.0, old, 0, config)
+        old = _NOW - timedelta(days=100)
+        s_f, s_m, s_s = decay_traces(1.0, 1.0, 1.0, old, 0, config, now=_NOW)
         assert s_f >= 0.0
         assert s_m >= 0.0
         assert s_s >= 0.0
 
+    def test_batch_fallback_matches_scalar(self, config, monkeypatch):
+        monkeypatch.setattr("engram.core.traces._rs_decay_traces_batch", None)
+        traces = [(1.0, 0.5, 0.2), (0.3, 0.9, 0.6)]
+        days = [3.0, 40.0]
+        counts = [0, 7]
+        batch = decay_traces_batch(traces, days, counts, config)
+        for got, t, d, c in zip(batch, traces, days, counts):
+            expected = decay_traces(*t, _NOW - timedelta(days=d), c, config, now=_NOW)
+            assert got == pytest.approx(expected)
+
 
 class TestCascadeTraces:
     def test_normal_cascade_fast_to_mid(self, config):
@@ -141,6 +165,13 @@ class TestCascadeTraces:
         assert 0.0 <= s_m <= 1.0
         assert 0.0 <= s_s <= 1.0
 
+    @pytest.mark.parametrize("deep_sleep", [False, True])
+    def test_batch_matches_scalar(self, config, deep_sleep):
+        traces = [(1.0, 0.0, 0.0), (0.4, 0.8, 0.95), (0.0, 1.0, 1.0)]
+        batch = cascade_traces_batch(traces, config, deep_sleep=deep_sleep)
+        for got, t in zip(batch, traces):
+            assert got == pytest.approx(cascade_traces(*t, config, deep_sleep=deep_sleep))
+
 
 class TestBoostFastTrace:
     def test_basic_boost(self):